@@ -0,0 +1,215 @@
+# algos/arbre_couvrant.py
+# Moteurs d'arbre (forêt) couvrant minimal sur GrapheCompact non orienté.
+import numpy as np
+
+
+def _etiqueter_composantes(racines):
+    """Renumérote des représentants union-find en étiquettes 0..c-1 (ordre de première apparition)."""
+    _, premiers, etiquettes = np.unique(racines, return_index=True, return_inverse=True)
+    # Renumérotation par première apparition pour que la composante de 0 soit la composante 0
+    ordre = np.argsort(premiers, kind='stable')
+    rang = np.empty_like(ordre)
+    rang[ordre] = np.arange(len(ordre))
+    return rang[etiquettes]
+
+
+def kruskal_foret(graphe):
+    """
+    Forêt couvrante minimale par Kruskal : un seul tri (argsort NumPy) des poids, puis
+    union-find avec compression de chemin (par division) et union par rang.
+    Le parcours s'arrête dès que n - 1 - (nœuds isolés) arêtes sont acceptées, c'est-à-dire
+    dès que tous les nœuds non isolés sont reliés ; sinon il va jusqu'au bout de la liste,
+    et le nombre de composantes vaut n - arêtes acceptées (aucune passe de connexité séparée).
+
+    Args:
+        graphe (GrapheCompact): Graphe non orienté.
+
+    Returns:
+        tuple: (aretes, composantes, nb_composantes)
+            aretes (np.ndarray): Indices des arêtes retenues, par poids croissant.
+            composantes (np.ndarray): Étiquette de composante de chaque nœud.
+            nb_composantes (int): Nombre de composantes connexes (= nombre d'arbres de la forêt).
+    """
+    n = graphe.nb_noeuds
+    parent = list(range(n))
+    rang = [0] * n
+    isoles = int(np.count_nonzero(graphe.degres() == 0))
+    objectif = max(n - 1 - isoles, 0)
+
+    ordre = np.argsort(graphe.poids, kind='stable')
+    u, v = graphe.u[ordre].tolist(), graphe.v[ordre].tolist()
+    acceptees = []
+    if objectif:
+        for k, (a, b) in enumerate(zip(u, v)):
+            while parent[a] != a:
+                parent[a] = parent[parent[a]]
+                a = parent[a]
+            while parent[b] != b:
+                parent[b] = parent[parent[b]]
+                b = parent[b]
+            if a == b:
+                continue
+            if rang[a] < rang[b]:
+                a, b = b, a
+            parent[b] = a
+            if rang[a] == rang[b]:
+                rang[a] += 1
+            acceptees.append(k)
+            if len(acceptees) == objectif:
+                break
+
+    # Représentant final de chaque nœud (compression complète, vectorisée)
+    racines = np.asarray(parent, dtype=np.int64)
+    while True:
+        suivantes = racines[racines]
+        if np.array_equal(suivantes, racines):
+            break
+        racines = suivantes
+    aretes = ordre[np.asarray(acceptees, dtype=np.int64)]
+    return aretes, _etiqueter_composantes(racines), n - len(acceptees)
+
+
+def poids_par_composante(graphe, aretes, composantes, nb_composantes):
+    """Poids de l'arbre couvrant de chaque composante (tableau de longueur nb_composantes)."""
+    poids = np.bincount(composantes[graphe.u[aretes]], weights=graphe.poids[aretes], minlength=nb_composantes)
+    return poids.astype(graphe.poids.dtype)
+
+
+SEUIL_DENSITE_PRIM = 0.5 # Au-delà, Prim en O(n²) évite le tri des ~n²/2 arêtes
+ARETES_MIN_BORUVKA = 20000 # En dessous, la boucle union-find de Kruskal reste la plus rapide
+
+
+def _cles_totales(graphe):
+    """
+    Clé entière unique par arête, compatible avec l'ordre (poids, indice) de Kruskal :
+    cle = rang_du_poids * m + indice, donc indice = cle % m. Pour des poids entiers,
+    le rang est (poids - poids_min) et aucun tri n'est nécessaire.
+    """
+    m = graphe.nb_aretes
+    poids = graphe.poids
+    ids = np.arange(m, dtype=np.int64)
+    if m and np.issubdtype(poids.dtype, np.integer):
+        etendue = int(poids.max()) - int(poids.min()) + 1
+        if etendue * m < 2 ** 62:
+            return (poids.astype(np.int64) - int(poids.min())) * m + ids
+    rang = np.empty(m, dtype=np.int64)
+    rang[np.argsort(poids, kind='stable')] = ids
+    return rang * m + ids
+
+
+def _trier_aretes(graphe, aretes):
+    """Range les arêtes retenues dans l'ordre de Kruskal (poids, indice) : sortie identique entre moteurs."""
+    aretes = np.asarray(aretes, dtype=np.int64)
+    return aretes[np.lexsort((aretes, graphe.poids[aretes]))]
+
+
+def prim_dense(graphe):
+    """
+    Forêt couvrante minimale par Prim en tableau, O(n² + m) sans tri ni tas :
+    chaque étape prend le nœud de clé minimale (argmin NumPy) puis relâche sa ligne CSR.
+    La clé d'un nœud est la clé totale (`_cles_totales`) de sa meilleure arête, qui en donne
+    l'indice ; quand la clé minimale est infinie, un nouvel arbre démarre (graphe non connexe).
+
+    Returns:
+        tuple: (aretes, composantes, nb_composantes), comme `kruskal_foret`.
+    """
+    n, m = graphe.nb_noeuds, graphe.nb_aretes
+    infini = np.iinfo(np.int64).max - 1
+    visite_cle = infini + 1 # Clé des nœuds déjà dans l'arbre
+    cles_csr = _cles_totales(graphe)[graphe.id_arete]
+    offsets, cibles = graphe.offsets, graphe.cibles
+
+    cle = np.full(n, infini, dtype=np.int64)
+    composantes = np.empty(n, dtype=np.int64)
+    aretes = []
+    nb_composantes = -1
+    for _ in range(n):
+        x = int(np.argmin(cle))
+        if cle[x] == infini:
+            nb_composantes += 1 # Nouvel arbre
+        else:
+            aretes.append(int(cle[x]) % m)
+        composantes[x] = nb_composantes
+        cle[x] = visite_cle
+        debut, fin = offsets[x], offsets[x + 1]
+        voisins, k = cibles[debut:fin], cles_csr[debut:fin]
+        garder = cle[voisins] != visite_cle
+        np.minimum.at(cle, voisins[garder], k[garder])
+    return _trier_aretes(graphe, aretes), composantes, nb_composantes + 1
+
+
+def boruvka(graphe):
+    """
+    Forêt couvrante minimale par Borůvka vectorisé : à chaque tour, l'arête la moins chère
+    de chaque composante est trouvée pour toutes les composantes à la fois (np.minimum.at),
+    puis les composantes sont fusionnées par saut de pointeurs. O(log n) tours de O(m).
+
+    Returns:
+        tuple: (aretes, composantes, nb_composantes), comme `kruskal_foret`.
+    """
+    n, m = graphe.nb_noeuds, graphe.nb_aretes
+    infini = np.iinfo(np.int64).max
+    cles = _cles_totales(graphe)
+    u, v = graphe.u, graphe.v
+    comp = np.arange(n, dtype=np.int64) # Représentant de la composante de chaque nœud
+    tous = np.arange(n, dtype=np.int64)
+    choisies = []
+    restantes = np.arange(m, dtype=np.int64) # Arêtes encore entre deux composantes distinctes
+    while True:
+        cu, cv = comp[u[restantes]], comp[v[restantes]]
+        entre = cu != cv
+        restantes, cu, cv = restantes[entre], cu[entre], cv[entre]
+        if not len(restantes):
+            break
+        k = cles[restantes]
+        meilleure = np.full(n, infini, dtype=np.int64)
+        np.minimum.at(meilleure, cu, k)
+        np.minimum.at(meilleure, cv, k)
+        c = np.flatnonzero(meilleure < infini)
+        e = meilleure[c] % m
+        choisies.append(np.unique(e))
+
+        # Chaque composante pointe vers sa voisine ; les paires mutuelles (même arête) gardent le plus petit comme racine
+        pointeur = tous.copy()
+        pointeur[c] = comp[u[e]] + comp[v[e]] - c
+        mutuel = (pointeur[pointeur] == tous) & (tous < pointeur)
+        pointeur[mutuel] = tous[mutuel]
+        while True:
+            suivant = pointeur[pointeur]
+            if np.array_equal(suivant, pointeur):
+                break
+            pointeur = suivant
+        comp = pointeur[comp]
+
+    aretes = np.concatenate(choisies) if choisies else np.empty(0, dtype=np.int64)
+    composantes = _etiqueter_composantes(comp)
+    return _trier_aretes(graphe, aretes), composantes, int(composantes.max(initial=-1)) + 1
+
+
+MOTEURS = {'kruskal': kruskal_foret, 'prim': prim_dense, 'boruvka': boruvka}
+
+
+def choisir_moteur(graphe):
+    """Moteur adapté à la densité : Prim pour les graphes denses, Borůvka pour les grands graphes creux."""
+    n, m = graphe.nb_noeuds, graphe.nb_aretes
+    paires = n * (n - 1) // 2
+    if paires and m / paires >= SEUIL_DENSITE_PRIM:
+        return 'prim'
+    if m >= ARETES_MIN_BORUVKA:
+        return 'boruvka'
+    return 'kruskal'
+
+
+def foret_couvrante_minimale(graphe, moteur='auto'):
+    """
+    Forêt couvrante minimale avec le moteur choisi ('kruskal', 'prim', 'boruvka' ou 'auto').
+    Tous les moteurs rendent exactement la même sortie (égalités départagées par indice d'arête).
+
+    Returns:
+        tuple: (aretes, composantes, nb_composantes, moteur)
+    """
+    if moteur == 'auto':
+        moteur = choisir_moteur(graphe)
+    if moteur not in MOTEURS:
+        raise ValueError(f"Moteur inconnu : '{moteur}' (attendu 'auto', 'kruskal', 'prim' ou 'boruvka').")
+    return (*MOTEURS[moteur](graphe), moteur)
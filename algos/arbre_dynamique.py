@@ -0,0 +1,208 @@
+# algos/arbre_dynamique.py
+# Forêt couvrante minimale maintenue sous insertions, suppressions et changements de poids d'arêtes,
+# sans relancer Kruskal : chaque mise à jour ne touche que l'arbre concerné.
+from collections import deque
+import numpy as np
+from algos.arbre_couvrant import foret_couvrante_minimale
+
+
+class ForetCouvranteDynamique:
+    """
+    Forêt couvrante minimale dynamique.
+
+    Les arêtes sont gardées dans des tableaux NumPy extensibles (indice d'arête stable),
+    la forêt dans des listes d'adjacence {voisin: indice d'arête}. Les égalités de poids
+    sont départagées par indice d'arête, comme dans `algos.arbre_couvrant`.
+
+    Coût des mises à jour (arbre de taille t, m arêtes) :
+      - insertion / baisse de poids : chemin dans l'arbre, O(t) ;
+      - suppression / hausse de poids d'une arête de l'arbre : marquage d'un côté de la
+        coupe en O(t), puis recherche vectorisée de la remplaçante la moins chère en O(m).
+    Chaque opération renvoie (ajoutees, retirees), les indices des arêtes entrées dans la forêt
+    et sorties de la forêt, pour ne redessiner que celles-ci.
+    """
+
+    def __init__(self, graphe, moteur='auto'):
+        self.noms = graphe.noms
+        self.nb_noeuds = n = graphe.nb_noeuds
+        m = graphe.nb_aretes
+        capacite = max(16, 2 * m)
+        self._u = np.zeros(capacite, dtype=np.int64)
+        self._v = np.zeros(capacite, dtype=np.int64)
+        self._poids = np.zeros(capacite, dtype=graphe.poids.dtype if m else np.int64)
+        self._actif = np.zeros(capacite, dtype=bool)
+        self._dans_foret = np.zeros(capacite, dtype=bool)
+        self._u[:m], self._v[:m], self._poids[:m] = graphe.u, graphe.v, graphe.poids
+        self._actif[:m] = True
+        self._m = m
+
+        aretes, _, self.nb_composantes, _ = foret_couvrante_minimale(graphe, moteur)
+        self._adjacence = [dict() for _ in range(n)]
+        for e in aretes.tolist():
+            self._lier(e)
+
+    # --- Accès ---
+
+    def arete(self, e):
+        """(nom_u, nom_v, poids) de l'arête e."""
+        return self.noms[self._u[e]], self.noms[self._v[e]], self._poids[e].item()
+
+    def aretes_foret(self):
+        """Indices des arêtes de la forêt."""
+        return np.flatnonzero(self._dans_foret[:self._m])
+
+    @property
+    def poids_total(self):
+        return self._poids[:self._m][self._dans_foret[:self._m]].sum().item()
+
+    # --- Outils internes ---
+
+    def _cle(self, e):
+        return (self._poids[e].item(), e)
+
+    def _lier(self, e):
+        a, b = int(self._u[e]), int(self._v[e])
+        self._adjacence[a][b] = e
+        self._adjacence[b][a] = e
+        self._dans_foret[e] = True
+
+    def _delier(self, e):
+        a, b = int(self._u[e]), int(self._v[e])
+        del self._adjacence[a][b]
+        del self._adjacence[b][a]
+        self._dans_foret[e] = False
+
+    def _chemin(self, a, b):
+        """Arêtes du chemin a-b dans la forêt (None si a et b sont dans deux arbres différents)."""
+        arrivee = {a: None} # nœud -> arête par laquelle on l'a atteint
+        file = deque([a])
+        while file and b not in arrivee:
+            x = file.popleft()
+            for y, e in self._adjacence[x].items():
+                if y not in arrivee:
+                    arrivee[y] = e
+                    file.append(y)
+        if b not in arrivee:
+            return None
+        chemin = []
+        x = b
+        while x != a:
+            e = arrivee[x]
+            chemin.append(e)
+            x = int(self._u[e]) if int(self._v[e]) == x else int(self._v[e])
+        return chemin
+
+    def _cote(self, a):
+        """Masque des nœuds de l'arbre de a (parcours de la forêt)."""
+        cote = np.zeros(self.nb_noeuds, dtype=bool)
+        cote[a] = True
+        pile = [a]
+        while pile:
+            x = pile.pop()
+            for y in self._adjacence[x]:
+                if not cote[y]:
+                    cote[y] = True
+                    pile.append(y)
+        return cote
+
+    def _remplacer(self, e):
+        """e vient de quitter la forêt : cherche l'arête la moins chère qui reconnecte les deux côtés."""
+        cote = self._cote(int(self._u[e]))
+        m = self._m
+        # Les arêtes hors forêt relient toujours deux nœuds d'un même arbre : traverser la coupe
+        # revient donc à avoir exactement une extrémité du côté marqué.
+        candidates = np.flatnonzero(
+            self._actif[:m] & ~self._dans_foret[:m] & (cote[self._u[:m]] != cote[self._v[:m]])
+        )
+        if not len(candidates):
+            self.nb_composantes += 1
+            return None
+        r = int(candidates[np.argmin(self._poids[candidates])]) # Premier minimum = plus petit indice
+        self._lier(r)
+        return r
+
+    def _essayer_raccourci(self, e):
+        """e (active, hors forêt) : l'ajoute si elle relie deux arbres ou bat le max du cycle créé."""
+        a, b = int(self._u[e]), int(self._v[e])
+        if a == b:
+            return [], []
+        chemin = self._chemin(a, b)
+        if chemin is None:
+            self._lier(e)
+            self.nb_composantes -= 1
+            return [e], []
+        pire = max(chemin, key=self._cle)
+        if self._cle(e) < self._cle(pire):
+            self._delier(pire)
+            self._lier(e)
+            return [e], [pire]
+        return [], []
+
+    def _agrandir(self):
+        capacite = 2 * len(self._u)
+        for nom in ('_u', '_v', '_poids', '_actif', '_dans_foret'):
+            ancien = getattr(self, nom)
+            nouveau = np.zeros(capacite, dtype=ancien.dtype)
+            nouveau[:len(ancien)] = ancien
+            setattr(self, nom, nouveau)
+
+    # --- Mises à jour ---
+
+    def inserer(self, a, b, poids):
+        """
+        Ajoute l'arête (a, b) (indices de nœuds) : si elle ferme un cycle, elle remplace
+        l'arête la plus lourde du cycle quand elle est plus légère.
+
+        Returns:
+            tuple: (e, ajoutees, retirees) avec e l'indice de la nouvelle arête.
+        """
+        if self._m == len(self._u):
+            self._agrandir()
+        e = self._m
+        self._u[e], self._v[e], self._poids[e] = a, b, poids
+        self._actif[e] = True
+        self._m += 1
+        return (e, *self._essayer_raccourci(e))
+
+    def supprimer(self, e):
+        """
+        Retire l'arête e ; si elle était dans la forêt, la remplace par l'arête la moins chère
+        qui traverse la coupe (s'il y en a une).
+
+        Returns:
+            tuple: (ajoutees, retirees)
+        """
+        if not (0 <= e < self._m) or not self._actif[e]:
+            raise KeyError(e)
+        self._actif[e] = False
+        if not self._dans_foret[e]:
+            return [], []
+        self._delier(e)
+        r = self._remplacer(e)
+        return ([r] if r is not None else []), [e]
+
+    def modifier_poids(self, e, poids):
+        """
+        Change le poids de l'arête e.
+          - arête de la forêt alourdie : elle est remise en concurrence avec les arêtes de sa coupe ;
+          - arête hors forêt allégée : elle est testée contre le max de son cycle ;
+          - les deux autres cas ne changent rien à la forêt.
+
+        Returns:
+            tuple: (ajoutees, retirees)
+        """
+        if not (0 <= e < self._m) or not self._actif[e]:
+            raise KeyError(e)
+        ancien = self._poids[e].item()
+        self._poids[e] = poids
+        if self._dans_foret[e]:
+            if poids <= ancien:
+                return [], []
+            self._delier(e)
+            r = self._remplacer(e) # e fait partie des candidates
+            if r == e:
+                return [], []
+            return ([r] if r is not None else []), [e]
+        if poids >= ancien:
+            return [], []
+        return self._essayer_raccourci(e)
@@ -1,35 +1,161 @@
 # algos/bellmanford.py
 import random
-import string
 import networkx as nx
-from itertools import product
 import math # Pour math.ceil ou round
+import numpy as np
+from collections import deque
+from algos.graphe import GrapheCompact
+from algos.generateur import generer_aretes
+from algos.noms import est_nom_valide
 
-def generer_noms_alphabétiques(n):
-    # ... (fonction inchangée)
-    noms = []
-    alphabet = string.ascii_uppercase
-    num_chars = 1
-    while len(noms) < n:
-        for p in product(alphabet, repeat=num_chars):
-            if len(noms) < n:
-                noms.append("".join(p))
-            else:
-                break
-        if len(noms) >= n:
+SEUIL_DENSITE_VECTORISE = 0.1 # Au-delà, le mode NumPy est choisi automatiquement
+
+
+def _noeud_sur_cycle_predecesseurs(pred):
+    """
+    Cherche un cycle dans le graphe des prédécesseurs (qui, dans Bellman-Ford, est
+    forcément un cycle négatif). Sauts de pointeurs vectorisés : O(n log n).
+
+    Returns:
+        int: Un nœud situé sur un cycle, ou -1 s'il n'y en a pas.
+    """
+    n = len(pred)
+    if n == 0:
+        return -1
+    # Les racines (pred == -1) pointent vers une sentinelle n qui boucle sur elle-même
+    saut = np.asarray(pred, dtype=np.int64).copy()
+    saut[saut < 0] = n
+    saut = np.append(saut, n)
+    pas = 1
+    while pas < n: # Après >= n pas, tout nœud hors d'un arbre enraciné est sur un cycle
+        saut = saut[saut]
+        pas *= 2
+    sur_cycle = np.flatnonzero(saut[:n] != n)
+    return int(saut[sur_cycle[0]]) if len(sur_cycle) else -1
+
+
+def _extraire_cycle(pred, x):
+    """Liste des nœuds du cycle passant par x, dans le sens des arcs."""
+    cycle = [x]
+    y = pred[x]
+    while y != x:
+        cycle.append(y)
+        y = pred[y]
+    cycle.reverse()
+    return cycle
+
+
+def _bellman_ford_file(graphe, source):
+    """
+    Variante à file (SPFA) : seuls les arcs sortants des nœuds dont la distance a changé sont relâchés.
+    Le graphe des prédécesseurs est inspecté toutes les n relaxations (coût amorti O(log n)
+    par relaxation), ce qui détecte un cycle négatif bien avant n tours complets.
+    """
+    n = graphe.nb_noeuds
+    offsets = graphe.offsets.tolist()
+    cibles = graphe.cibles.tolist()
+    poids_csr = graphe.poids_csr.tolist()
+    dist = [float('inf')] * n
+    pred = [-1] * n
+    longueur = [0] * n # Nombre d'arcs du chemin courant : >= n signifie cycle négatif
+    dans_file = [False] * n
+    dist[source] = 0
+    file = deque([source])
+    dans_file[source] = True
+    relaxations = 0
+    while file: # La file vide joue le rôle de l'arrêt anticipé
+        u = file.popleft()
+        dans_file[u] = False
+        d_u = dist[u]
+        for k in range(offsets[u], offsets[u + 1]):
+            v = cibles[k]
+            if d_u + poids_csr[k] < dist[v]:
+                dist[v] = d_u + poids_csr[k]
+                pred[v] = u
+                longueur[v] = longueur[u] + 1
+                relaxations += 1
+                if longueur[v] >= n:
+                    # Remonter n fois les prédécesseurs depuis v mène forcément sur le cycle
+                    x = v
+                    for _ in range(n):
+                        x = pred[x]
+                    return dist, pred, _extraire_cycle(pred, x)
+                if relaxations % n == 0:
+                    x = _noeud_sur_cycle_predecesseurs(pred)
+                    if x != -1:
+                        return dist, pred, _extraire_cycle(pred, x)
+                if not dans_file[v]:
+                    dans_file[v] = True
+                    file.append(v)
+    return dist, pred, None
+
+
+def _bellman_ford_vectorise(graphe, source):
+    """
+    Variante NumPy : chaque tour relâche tous les arcs d'un coup avec np.minimum.at.
+    Le graphe des prédécesseurs est inspecté après chaque tour qui modifie des distances.
+    """
+    n = graphe.nb_noeuds
+    u, v = graphe.u, graphe.v
+    poids = graphe.poids.astype(np.float64)
+    dist = np.full(n, np.inf)
+    pred = np.full(n, -1, dtype=np.int64)
+    dist[source] = 0.0
+    cycle = None
+    for tour in range(n): # N-1 tours + 1 tour de vérification
+        candidats = dist[u] + poids
+        nouvelles = dist.copy()
+        np.minimum.at(nouvelles, v, candidats)
+        ameliore = nouvelles < dist
+        if not ameliore.any():
+            break # Arrêt anticipé : plus aucune distance ne change
+        gagnants = ameliore[v] & (candidats == nouvelles[v])
+        pred[v[gagnants]] = u[gagnants]
+        dist = nouvelles
+        x = _noeud_sur_cycle_predecesseurs(pred)
+        if x != -1:
+            cycle = _extraire_cycle(pred.tolist(), x)
             break
-        num_chars += 1
-    return noms
 
+    entiers = np.issubdtype(graphe.poids.dtype, np.integer)
+    dist_liste = [int(d) if entiers and abs(d) != np.inf else float(d) for d in dist.tolist()]
+    return dist_liste, pred.tolist(), cycle
+
+
+def bellman_ford_moteur(graphe, source, moteur='auto'):
+    """
+    Cœur de Bellman-Ford sur un graphe compact orienté.
 
-def bellman_ford_graph(nb_nodes, source, destination=None):
+    Args:
+        graphe (GrapheCompact): Graphe orienté pondéré.
+        source (int): Indice du nœud source.
+        moteur (str): 'file' (SPFA), 'vectorise' (NumPy) ou 'auto' (choix selon la densité).
+
+    Returns:
+        tuple: (dist, pred, cycle)
+            dist (list): Distances depuis la source (float('inf') si inaccessible).
+            pred (list): Prédécesseur de chaque nœud (-1 si aucun).
+            cycle (list): Nœuds d'un cycle négatif atteignable depuis la source,
+                dans le sens des arcs, ou None s'il n'y en a pas.
+    """
+    if moteur == 'auto':
+        n = graphe.nb_noeuds
+        densite = graphe.nb_aretes / (n * (n - 1) / 2) if n > 1 else 0.0
+        moteur = 'vectorise' if densite >= SEUIL_DENSITE_VECTORISE else 'file'
+    if moteur == 'file':
+        return _bellman_ford_file(graphe, source)
+    if moteur == 'vectorise':
+        return _bellman_ford_vectorise(graphe, source)
+    raise ValueError(f"Moteur Bellman-Ford inconnu : '{moteur}' (attendu 'auto', 'file' ou 'vectorise').")
+
+
+def bellman_ford_graph(nb_nodes, source, destination=None, moteur='auto', valeurs_poids=(1, 200)):
     if nb_nodes <= 0:
         return "Erreur: Le nombre de nœuds doit être positif.", {}, None, None, 0
 
-    nodes = generer_noms_alphabétiques(nb_nodes)
-    if source not in nodes:
+    if not est_nom_valide(source, nb_nodes):
         return f"Erreur: Le nœud source '{source}' n'est pas valide pour {nb_nodes} nœuds.", {}, None, None, 0
-    if destination and destination not in nodes:
+    if destination and not est_nom_valide(destination, nb_nodes):
         return f"Erreur: Le nœud destination '{destination}' n'est pas valide pour {nb_nodes} nœuds.", {}, None, None, 0
     
     if destination == source: 
@@ -40,9 +166,6 @@ def bellman_ford_graph(nb_nodes, source, destination=None):
         return f"Distances depuis {source}:\n{source} : 0\n\nChemin de {source} à {destination} : (aucun)\nDistance : 0", \
                {source: 0}, G_trivial, [], conn_rate_trivial
 
-    G = nx.DiGraph()
-    G.add_nodes_from(nodes)
-
     connectivity_density_factor = random.uniform(0, 1) # Assurer une petite densité minimale si nb_nodes > 1
 
     # Maximum possible d'arêtes uniques non-bidirectionnelles.
@@ -70,36 +193,14 @@ def bellman_ford_graph(nb_nodes, source, destination=None):
         num_edges_to_generate = 0
     # --- FIN MODIFICATION ---
 
-    edges_added = 0
-    
-    possible_undirected_pairs = []
-    if nb_nodes > 1:
-        # Créer des paires non orientées (u,v) où u < v alphabétiquement pour éviter doublons et auto-boucles
-        for i in range(nb_nodes):
-            for j in range(i + 1, nb_nodes):
-                possible_undirected_pairs.append((nodes[i], nodes[j]))
-    random.shuffle(possible_undirected_pairs)
-
-    for u_pair, v_pair in possible_undirected_pairs:
-        if edges_added >= num_edges_to_generate:
-            break
-        
-        # Choisir aléatoirement la direction de l'arête pour cette paire
-        if random.choice([True, False]):
-            u, v = u_pair, v_pair
-        else:
-            u, v = v_pair, u_pair
-            
-        # S'assurer que l'arête n'existe pas DÉJÀ (ne devrait pas arriver avec cette logique)
-        # et que l'inverse n'existe pas (la logique de paire non-orientée le garantit)
-        if not G.has_edge(u,v): # L'inverse ne sera pas là car on traite chaque paire une fois
-            weight = random.randint(1, 200) # Poids par défaut, peut inclure négatifs si Bellman-Ford
-            # Pour éviter les cycles négatifs faciles, on peut limiter les poids négatifs.
-            # Par exemple, faire que les poids négatifs soient moins fréquents ou moins importants.
-            # if random.random() < 0.15: # 15% de chance d'avoir un poids négatif
-            #    weight = random.randint(-50, -1) 
-            G.add_edge(u, v, weight=weight)
-            edges_added += 1
+    # Tirage direct de paires non orientées distinctes, chacune avec une direction aléatoire :
+    # ni doublon, ni arête inverse, ni liste des N(N-1)/2 paires en mémoire.
+    # Poids positifs par défaut ; valeurs_poids=(-50, 200) par exemple autorise des cycles négatifs.
+    aretes_u, aretes_v, aretes_poids = generer_aretes(nb_nodes, num_edges_to_generate, valeurs=valeurs_poids, oriente=True)
+    edges_added = len(aretes_u)
+
+    graphe = GrapheCompact(nb_nodes, aretes_u, aretes_v, aretes_poids, oriente=True, attribut='weight')
+    G = graphe.vers_networkx() # Uniquement pour le dessin dans l'interface
             
     # Calcul du taux de connectivité basé sur le nombre d'arêtes ajoutées
     # par rapport au maximum possible sous la contrainte de non-bidirectionnalité.
@@ -114,43 +215,30 @@ def bellman_ford_graph(nb_nodes, source, destination=None):
     connectivity_rate_percent = min(connectivity_rate_percent, 100.0) # Assurer la borne sup
 
     # --- Bellman-Ford Algorithm Core ---
-    # ... (Reste de la fonction inchangé) ...
+    # Moteur à file (SPFA) ou vectorisé (NumPy) selon `moteur`, sur le graphe compact.
     distances = {}
-    predecessors = {} 
     try:
-        for node in G.nodes():
-            distances[node] = float('inf')
-            predecessors[node] = None
-        
-        if source not in G: 
-             return f"Erreur interne: Nœud source '{source}' non trouvé dans le graphe G.", {}, G, None, connectivity_rate_percent
-        distances[source] = 0
-
-        num_graph_nodes = G.number_of_nodes()
-        for i in range(num_graph_nodes - 1): # N-1 itérations
-            changed_in_iteration = False
-            for u_edge, v_edge, data_edge in G.edges(data=True):
-                weight_edge = data_edge['weight']
-                if distances.get(u_edge, float('inf')) != float('inf') and \
-                   distances[u_edge] + weight_edge < distances.get(v_edge, float('inf')):
-                    distances[v_edge] = distances[u_edge] + weight_edge
-                    predecessors[v_edge] = u_edge
-                    changed_in_iteration = True
-            # Optimisation: si aucune distance n'a changé lors d'une itération, on peut s'arrêter
-            if not changed_in_iteration and i > 0: # i > 0 pour s'assurer qu'au moins une itération complète a eu lieu
-                break 
+        num_graph_nodes = graphe.nb_noeuds
+        i_source = graphe.index(source)
+        dist, pred, cycle = bellman_ford_moteur(graphe, i_source, moteur)
+
+        distances = {nom: dist[i] for i, nom in enumerate(graphe.noms)}
+        predecessors = {nom: (graphe.noms[pred[i]] if pred[i] != -1 else None) for i, nom in enumerate(graphe.noms)}
         
-        # Vérification des cycles négatifs
-        for u_edge, v_edge, data_edge in G.edges(data=True):
-            weight_edge = data_edge['weight']
-            if distances.get(u_edge, float('inf')) != float('inf') and \
-               distances[u_edge] + weight_edge < distances.get(v_edge, float('inf')):
-                # Pour rendre le graphe toujours visualisable, même avec cycle négatif,
-                # on ne retourne pas None pour G. L'interface affichera le message d'erreur.
-                return "Cycle négatif détecté ! Les distances ne sont pas fiables.", distances, G, None, connectivity_rate_percent
+        # Cycle négatif extrait par le moteur
+        if cycle is not None:
+            # Pour rendre le graphe toujours visualisable, même avec cycle négatif,
+            # on ne retourne pas None pour G. Les arêtes du cycle remplacent le chemin
+            # pour que l'interface puisse les mettre en évidence.
+            noms_cycle = [graphe.noms[i] for i in cycle]
+            aretes_cycle = list(zip(noms_cycle, noms_cycle[1:] + noms_cycle[:1]))
+            poids_cycle = sum(G[a][b]['weight'] for a, b in aretes_cycle)
+            texte_cycle = "Cycle négatif détecté ! Les distances ne sont pas fiables.\n"
+            texte_cycle += f"Cycle : {' → '.join(noms_cycle + noms_cycle[:1])} (poids total {poids_cycle})"
+            return texte_cycle, distances, G, aretes_cycle, connectivity_rate_percent
 
         result_text = f"Distances les plus courtes depuis {source} (Bellman-Ford):\n"
-        for node_key in sorted(nodes): # Utiliser `nodes` pour un ordre cohérent
+        for node_key in sorted(graphe.noms): # Ordre alphabétique cohérent
             d = distances.get(node_key, float('inf'))
             result_text += f"  - {node_key} : {d if d != float('inf') else '∞ (non accessible)'}\n"
         
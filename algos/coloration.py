@@ -0,0 +1,323 @@
+# algos/coloration.py
+# Moteurs de coloration sur GrapheCompact. Les couleurs sont des entiers 0..k-1 ;
+# la correspondance vers des couleurs d'affichage se fait seulement au dessin (voir algos.welsh).
+import time
+import numpy as np
+from algos.generateur import rng_par_defaut
+
+
+def ordre_welsh_powell(graphe):
+    """Nœuds par degré décroissant (égalités dans l'ordre des indices)."""
+    return np.argsort(-graphe.degres(), kind='stable')
+
+
+def glouton(graphe, ordre):
+    """
+    Coloration gloutonne (première couleur libre) dans l'ordre donné.
+    Les couleurs interdites du nœud x sont marquées dans un tableau d'estampilles
+    (interdit[c] == x) : pas de remise à zéro entre deux nœuds, O(degré) par nœud.
+
+    Returns:
+        np.ndarray: Couleur (entier) de chaque nœud.
+    """
+    n = graphe.nb_noeuds
+    offsets, cibles = graphe.offsets.tolist(), graphe.cibles.tolist()
+    couleur = [-1] * n
+    interdit = [-1] * (int(graphe.degres().max(initial=0)) + 1) # Au plus degré + 1 couleurs utiles
+    for x in ordre.tolist():
+        for k in range(offsets[x], offsets[x + 1]):
+            c = couleur[cibles[k]]
+            if c >= 0:
+                interdit[c] = x
+        c = 0
+        while interdit[c] == x:
+            c += 1
+        couleur[x] = c
+    return np.asarray(couleur, dtype=np.int64)
+
+
+def welsh_powell(graphe):
+    """Welsh-Powell : glouton par degré décroissant."""
+    return glouton(graphe, ordre_welsh_powell(graphe))
+
+
+def dsatur(graphe):
+    """
+    DSATUR : colorie à chaque étape le nœud de plus forte saturation (nombre de couleurs
+    distinctes chez ses voisins).
+    File de priorité en paniers indexés par saturation, avec suppression paresseuse : un nœud
+    est réinséré quand sa saturation augmente, et les anciennes entrées sont ignorées au retrait.
+    Le panier 0 est rempli par degré croissant, donc dépilé par degré décroissant (ordre de
+    Welsh-Powell pour départager le début). Les couleurs vues par chaque nœud sont un bitset (entier Python).
+
+    Returns:
+        np.ndarray: Couleur (entier) de chaque nœud.
+    """
+    n = graphe.nb_noeuds
+    offsets, cibles = graphe.offsets.tolist(), graphe.cibles.tolist()
+    degres = graphe.degres().tolist()
+    couleur = [-1] * n
+    vues = [0] * n # Bitset des couleurs voisines
+    saturation = [0] * n
+    paniers = [[] for _ in range(max(degres, default=0) + 2)]
+    paniers[0] = ordre_welsh_powell(graphe)[::-1].tolist()
+    haut = 0
+    for _ in range(n):
+        while True:
+            while not paniers[haut]:
+                haut -= 1
+            x = paniers[haut].pop()
+            if couleur[x] < 0 and saturation[x] == haut: # Entrée encore valide
+                break
+        libres = ~vues[x]
+        c = (libres & -libres).bit_length() - 1 # Plus petite couleur absente chez les voisins
+        couleur[x] = c
+        bit = 1 << c
+        for k in range(offsets[x], offsets[x + 1]):
+            y = cibles[k]
+            if couleur[y] < 0 and not vues[y] & bit:
+                vues[y] |= bit
+                saturation[y] += 1
+                paniers[saturation[y]].append(y)
+                if saturation[y] > haut:
+                    haut = saturation[y]
+    return np.asarray(couleur, dtype=np.int64)
+
+
+def _plus_petite_couleur_libre(vues):
+    """
+    Plus petite couleur absente de chaque ligne d'un bitset (tableau uint64 de forme (k, mots)),
+    vectorisé : premier mot non plein, puis bit zéro le plus bas (isolé par x & -x).
+    """
+    libres = ~vues
+    non_plein = libres != 0
+    mot = np.argmax(non_plein, axis=1)
+    lignes = np.arange(len(vues))
+    x = libres[lignes, mot]
+    bas = x & (~x + np.uint64(1))
+    position = np.log2(bas.astype(np.float64)).astype(np.int64) # Exact : bas est une puissance de 2
+    plein = ~non_plein.any(axis=1) # Tous les mots pleins : première couleur du mot suivant
+    return np.where(plein, 64 * vues.shape[1], 64 * mot + position)
+
+
+def _arcs_depuis(graphe, noeuds):
+    """Positions CSR de tous les arcs sortant de `noeuds` (concaténées, sans boucle Python)."""
+    debuts = graphe.offsets[noeuds]
+    effectifs = graphe.offsets[noeuds + 1] - debuts
+    total = int(effectifs.sum())
+    decalage = np.repeat(debuts - np.cumsum(effectifs) + effectifs, effectifs)
+    return decalage + np.arange(total, dtype=np.int64)
+
+
+def jones_plassmann(graphe, rng=None):
+    """
+    Coloration parallèle de Jones-Plassmann : priorités aléatoires distinctes, et à chaque tour
+    tous les nœuds non colorés dont les voisins plus prioritaires sont déjà colorés
+    (ensemble indépendant) prennent leur plus petite couleur libre.
+    Le test de maximum local se fait par compteur : attente[x] = voisins plus prioritaires
+    encore non colorés ; un nœud est prêt quand son compteur tombe à 0. Chaque tour est
+    vectorisé sur les lignes CSR des nœuds qui viennent d'être colorés, donc chaque arc n'est
+    traité qu'une fois. Les couleurs prises autour de chaque nœud sont cumulées dans un bitset uint64.
+    Le résultat est celui du glouton dans l'ordre des priorités décroissantes.
+
+    Returns:
+        tuple: (couleurs, nb_tours)
+    """
+    rng = rng_par_defaut(rng)
+    n = graphe.nb_noeuds
+    priorite = rng.permutation(n)
+    couleur = np.full(n, -1, dtype=np.int64)
+    vues = np.zeros((n, 1), dtype=np.uint64) # Bitset des couleurs voisines (64 par mot)
+    source = np.repeat(np.arange(n, dtype=np.int64), graphe.degres())
+    descend = priorite[source] > priorite[graphe.cibles]
+    attente = np.bincount(graphe.cibles[descend], minlength=n)
+    prets = np.flatnonzero(attente == 0)
+    tours = 0
+    while len(prets):
+        tours += 1
+        couleur[prets] = _plus_petite_couleur_libre(vues[prets])
+
+        # Les voisins encore à colorier (tous moins prioritaires) notent la couleur prise
+        arcs = _arcs_depuis(graphe, prets)
+        voisins = graphe.cibles[arcs]
+        garder = couleur[voisins] < 0
+        voisins, prises = voisins[garder], couleur[source[arcs[garder]]]
+        if not len(voisins):
+            break
+        mots = int(prises.max()) // 64 + 1
+        if mots > vues.shape[1]:
+            vues = np.hstack((vues, np.zeros((n, mots - vues.shape[1]), dtype=np.uint64)))
+        bits = np.left_shift(np.uint64(1), (prises % 64).astype(np.uint64))
+        np.bitwise_or.at(vues, (voisins, prises // 64), bits)
+        attente -= np.bincount(voisins, minlength=n)
+        prets = np.unique(voisins[attente[voisins] == 0])
+    return couleur, tours
+
+
+def comparer_welsh_jones_plassmann(graphe, rng=None):
+    """
+    Banc d'essai sur un même graphe : Welsh-Powell séquentiel contre Jones-Plassmann.
+
+    Returns:
+        list: [(methode, nb_couleurs, duree_s, nb_tours)] ; nb_tours vaut n pour Welsh-Powell
+        (un nœud par étape).
+    """
+    resultats = []
+    debut = time.perf_counter()
+    couleurs = welsh_powell(graphe)
+    resultats.append(('welsh', int(couleurs.max(initial=-1)) + 1, time.perf_counter() - debut, graphe.nb_noeuds))
+    debut = time.perf_counter()
+    couleurs, tours = jones_plassmann(graphe, rng)
+    resultats.append(('jones_plassmann', int(couleurs.max(initial=-1)) + 1, time.perf_counter() - debut, tours))
+    return resultats
+
+
+NOEUDS_MAX_EXACT = 80
+
+
+def _clique_gloutonne(adjacence, n):
+    """Clique maximale gloutonne (meilleure sur tous les nœuds de départ) : borne inférieure."""
+    meilleure = []
+    for depart in range(n):
+        clique = [depart]
+        candidats = adjacence[depart]
+        while candidats:
+            # Candidat ayant le plus de voisins parmi les candidats restants
+            x = max((y for y in range(n) if candidats >> y & 1), key=lambda y: (adjacence[y] & candidats).bit_count())
+            clique.append(x)
+            candidats &= adjacence[x]
+        if len(clique) > len(meilleure):
+            meilleure = clique
+    return meilleure
+
+
+def nombre_chromatique(graphe, budget_s=2.0):
+    """
+    Nombre chromatique exact par séparation et évaluation (DSATUR exact) sur des bitsets
+    en entiers Python, pour les petits graphes (au plus NOEUDS_MAX_EXACT nœuds).
+    Borne supérieure initiale : meilleure coloration entre Welsh-Powell et DSATUR ;
+    borne inférieure : clique gloutonne, dont les nœuds sont précolorés (0, 1, 2, ...)
+    pour casser les symétries. À chaque nœud de l'arbre, on branche sur le nœud de plus forte
+    saturation, et on coupe dès qu'il faudrait autant de couleurs que la meilleure solution.
+
+    Args:
+        graphe (GrapheCompact): Graphe non orienté.
+        budget_s (float): Temps maximal de recherche, en secondes.
+
+    Returns:
+        tuple: (couleurs, nb_couleurs, prouve)
+            prouve (bool): True si nb_couleurs est le nombre chromatique (recherche terminée).
+    """
+    n = graphe.nb_noeuds
+    if n > NOEUDS_MAX_EXACT:
+        raise ValueError(f"Coloration exacte limitée à {NOEUDS_MAX_EXACT} nœuds (graphe de {n} nœuds).")
+    if n == 0:
+        return np.empty(0, dtype=np.int64), 0, True
+
+    adjacence = [0] * n
+    for a, b in zip(graphe.u.tolist(), graphe.v.tolist()):
+        if a != b:
+            adjacence[a] |= 1 << b
+            adjacence[b] |= 1 << a
+
+    meilleure = min((welsh_powell(graphe), dsatur(graphe)), key=lambda c: int(c.max()))
+    meilleur_nb = int(meilleure.max()) + 1
+    clique = _clique_gloutonne(adjacence, n)
+    if len(clique) == meilleur_nb:
+        return meilleure, meilleur_nb, True
+
+    fin = time.perf_counter() + budget_s
+    couleur = [-1] * n
+    vues = [0] * n # Bitset des couleurs déjà prises par les voisins de chaque nœud
+    non_colores = (1 << n) - 1
+    for c, x in enumerate(clique):
+        couleur[x] = c
+        non_colores ^= 1 << x
+        for y in range(n):
+            if adjacence[x] >> y & 1:
+                vues[y] |= 1 << c
+    nb_classes = len(clique)
+    etat = {'noeuds': 0, 'interrompu': False}
+
+    def explorer(non_colores, nb_classes):
+        nonlocal meilleure, meilleur_nb
+        if nb_classes >= meilleur_nb:
+            return False # Déjà autant de couleurs que la meilleure solution
+        if not non_colores:
+            meilleure = np.asarray(couleur, dtype=np.int64)
+            meilleur_nb = nb_classes
+            return meilleur_nb == len(clique) # Borne inférieure atteinte : inutile de continuer
+        etat['noeuds'] += 1
+        if etat['noeuds'] & 1023 == 0 and time.perf_counter() > fin:
+            etat['interrompu'] = True
+            return True
+
+        # Nœud de plus forte saturation, à égalité le plus de voisins non colorés
+        choix, cle_choix = -1, (-1, -1)
+        reste = non_colores
+        while reste:
+            bas = reste & -reste
+            x = bas.bit_length() - 1
+            reste ^= bas
+            cle = (vues[x].bit_count(), (adjacence[x] & non_colores).bit_count())
+            if cle > cle_choix:
+                choix, cle_choix = x, cle
+
+        x = choix
+        non_colores ^= 1 << x
+        # Voisins non colorés de x, dont la saturation change avec la couleur de x
+        voisins = []
+        reste = adjacence[x] & non_colores
+        while reste:
+            bas = reste & -reste
+            voisins.append(bas.bit_length() - 1)
+            reste ^= bas
+        # Couleurs existantes permises, puis une nouvelle seulement si elle peut améliorer
+        possibles = [c for c in range(nb_classes) if not vues[x] >> c & 1]
+        if nb_classes + 1 < meilleur_nb:
+            possibles.append(nb_classes)
+        for c in possibles:
+            if c == nb_classes and c + 1 >= meilleur_nb:
+                break # La meilleure solution a pu s'améliorer entre-temps
+            couleur[x] = c
+            bit = 1 << c
+            modifies = [y for y in voisins if not vues[y] & bit]
+            for y in modifies:
+                vues[y] |= bit
+            arret = explorer(non_colores, max(nb_classes, c + 1))
+            for y in modifies:
+                vues[y] ^= bit
+            if arret:
+                return True
+        couleur[x] = -1
+        return False
+
+    explorer(non_colores, nb_classes)
+    return meilleure, meilleur_nb, not etat['interrompu']
+
+
+MOTEURS = {
+    'welsh': welsh_powell,
+    'dsatur': dsatur,
+    'jones_plassmann': lambda graphe: jones_plassmann(graphe)[0],
+    'exact': lambda graphe: nombre_chromatique(graphe)[0],
+}
+
+
+def colorier(graphe, methode='welsh'):
+    """
+    Coloration propre du graphe avec la méthode choisie ('welsh', 'dsatur', 'jones_plassmann' ou 'exact').
+
+    Returns:
+        tuple: (couleurs, nb_couleurs)
+    """
+    if methode not in MOTEURS:
+        raise ValueError(f"Méthode de coloration inconnue : '{methode}' (attendu {', '.join(MOTEURS)}).")
+    couleurs = MOTEURS[methode](graphe)
+    return couleurs, int(couleurs.max(initial=-1)) + 1
+
+
+def est_coloration_propre(graphe, couleurs):
+    """True si aucune arête ne relie deux nœuds de même couleur."""
+    couleurs = np.asarray(couleurs)
+    return not np.any(couleurs[graphe.u] == couleurs[graphe.v])
@@ -0,0 +1,223 @@
+# algos/cpm.py
+# Moteur CPM/MPM (méthode des potentiels) sur tableaux : noms de tâches internés en entiers,
+# prédécesseurs/successeurs en CSR, tri topologique de Kahn et dates calculées en O(V + E).
+from collections import deque
+import networkx as nx
+import numpy as np
+
+DEBUT, FIN = 'Début', 'Fin'
+
+
+def _csr(source, cible, n):
+    """(offsets, cibles, ids) des arcs regroupés par source."""
+    ordre = np.argsort(source, kind='stable')
+    offsets = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(source, minlength=n), out=offsets[1:])
+    return offsets, cible[ordre], ordre
+
+
+class ReseauCPM:
+    """
+    Réseau de tâches (potentiel-tâches) prêt pour le calcul des dates.
+
+    Les nœuds sont 0 = Début, 1..T = tâches utilisateur (dans l'ordre de `taches_input`),
+    T+1 = Fin. Une tâche sans prédécesseur suit Début ; une tâche qui n'est le prédécesseur
+    d'aucune autre précède Fin (comme dans `algos.mpm.algo_potentiel_metra`).
+
+    Attributs principaux :
+        noms (list), index (dict nom -> indice), durees (np.ndarray),
+        source, cible (np.ndarray) : arcs prédécesseur -> successeur,
+        succ_offsets / succ_cibles et pred_offsets / pred_sources : CSR dans les deux sens.
+    """
+
+    def __init__(self, taches_input, durees=None):
+        self.noms = [DEBUT, *taches_input, FIN]
+        self.index = {nom: i for i, nom in enumerate(self.noms)}
+        n = len(self.noms)
+        fin = n - 1
+
+        # Tous les prédécesseurs saisis à plat, convertis en indices d'un seul passage
+        preds_saisis = [data['pred'] for data in taches_input.values()]
+        self.preds_saisis = [[], *preds_saisis, []] # Tels que saisis (pour la sortie)
+        nb_preds = np.fromiter(map(len, preds_saisis), dtype=np.int64, count=len(preds_saisis))
+        a_plat = [nom for preds in preds_saisis for nom in preds]
+        source = np.fromiter((self.index.get(nom, -1) for nom in a_plat), dtype=np.int64, count=len(a_plat))
+        cible = np.repeat(np.arange(1, fin, dtype=np.int64), nb_preds)
+        valide = (source >= 0) & (source != fin)
+        source, cible = source[valide], cible[valide]
+        # Une tâche qui n'est le prédécesseur d'aucune autre précède Fin
+        a_un_successeur = np.bincount(source[source != cible], minlength=n) > 0
+        terminales = np.flatnonzero(~a_un_successeur[1:fin]) + 1
+        sans_pred = np.flatnonzero(nb_preds == 0) + 1
+        source = np.concatenate((np.zeros(len(sans_pred), dtype=np.int64), source, terminales))
+        cible = np.concatenate((sans_pred, cible, np.full(len(terminales), fin, dtype=np.int64)))
+        if n == 2:
+            source, cible = np.array([0]), np.array([fin])
+        # Arcs sans doublon (prédécesseur saisi deux fois)
+        source, cible = np.divmod(np.unique(source * n + cible), n)
+
+        self.source, self.cible = source.astype(np.int64), cible.astype(np.int64)
+        if durees is None:
+            durees = [0, *(data['duree'] for data in taches_input.values()), 0]
+        self.durees = np.asarray(durees)
+        self.succ_offsets, self.succ_cibles, _ = _csr(self.source, self.cible, n)
+        self.pred_offsets, self.pred_sources, _ = _csr(self.cible, self.source, n)
+        self._ordre = None
+        self._niveau = None
+
+    @property
+    def nb_taches(self):
+        return len(self.noms)
+
+    def _cycle(self, restants):
+        """Un cycle parmi les nœuds non triés (chacun y a encore un prédécesseur non trié)."""
+        pred_offsets, pred_sources = self.pred_offsets.tolist(), self.pred_sources.tolist()
+        x = next(iter(restants))
+        vus = {}
+        chemin = []
+        while x not in vus:
+            vus[x] = len(chemin)
+            chemin.append(x)
+            x = next(p for p in pred_sources[pred_offsets[x]:pred_offsets[x + 1]] if p in restants)
+        cycle = chemin[vus[x]:][::-1] # Remis dans le sens prédécesseur -> successeur
+        return [self.noms[i] for i in cycle + cycle[:1]]
+
+    def ordre_topologique(self):
+        """
+        Tri topologique de Kahn, par niveaux (niveau = plus long chemin en nombre d'arcs depuis une source).
+
+        Returns:
+            tuple: (ordre, niveau) tableaux NumPy ; `ordre` est trié par niveau.
+
+        Raises:
+            nx.NetworkXUnfeasible: Si les dépendances contiennent un cycle (le cycle est cité).
+        """
+        if self._ordre is not None:
+            return self._ordre, self._niveau
+        n = self.nb_taches
+        offsets, cibles = self.succ_offsets.tolist(), self.succ_cibles.tolist()
+        degre = np.bincount(self.cible, minlength=n).tolist()
+        niveau = [0] * n
+        ordre = [x for x in range(n) if degre[x] == 0]
+        file = deque(ordre)
+        while file:
+            x = file.popleft()
+            for k in range(offsets[x], offsets[x + 1]):
+                y = cibles[k]
+                degre[y] -= 1
+                if degre[y] == 0:
+                    niveau[y] = niveau[x] + 1 # Dernier prédécesseur retiré = celui de plus haut niveau
+                    ordre.append(y)
+                    file.append(y)
+        if len(ordre) < n:
+            restants = set(range(n)) - set(ordre)
+            cycle = " → ".join(self._cycle(restants))
+            raise nx.NetworkXUnfeasible(f"Cycle détecté dans les dépendances des tâches ({cycle}). Impossible de calculer MPM.")
+        self._ordre = np.asarray(ordre, dtype=np.int64)
+        self._niveau = np.asarray(niveau, dtype=np.int64)
+        return self._ordre, self._niveau
+
+    def _dates_liste(self, ordre):
+        """Passes avant/arrière en parcourant l'ordre topologique (efficace pour les graphes profonds)."""
+        n = self.nb_taches
+        d = self.durees.tolist()
+        pred_offsets, pred_sources = self.pred_offsets.tolist(), self.pred_sources.tolist()
+        succ_offsets, succ_cibles = self.succ_offsets.tolist(), self.succ_cibles.tolist()
+        ordre = ordre.tolist()
+        tot, tft = [0] * n, [0] * n
+        for x in ordre:
+            debut = 0
+            for k in range(pred_offsets[x], pred_offsets[x + 1]):
+                if tft[pred_sources[k]] > debut:
+                    debut = tft[pred_sources[k]]
+            tot[x] = debut
+            tft[x] = debut + d[x]
+        fin_projet = tft[n - 1]
+        tard, tftard = [0] * n, [0] * n
+        for x in reversed(ordre):
+            fin = fin_projet
+            for k in range(succ_offsets[x], succ_offsets[x + 1]):
+                if tard[succ_cibles[k]] < fin:
+                    fin = tard[succ_cibles[k]]
+            tftard[x] = fin
+            tard[x] = fin - d[x]
+        return tuple(np.asarray(t, dtype=self.durees.dtype) for t in (tot, tft, tard, tftard))
+
+    def _dates_niveaux(self, ordre, niveau):
+        """Passes avant/arrière vectorisées niveau par niveau (efficace pour les graphes larges)."""
+        n = self.nb_taches
+        d = self.durees
+        # Arcs regroupés par niveau de leur cible ; nœuds regroupés par niveau (ordre est déjà trié par niveau)
+        arcs = np.argsort(niveau[self.cible], kind='stable')
+        src, dst = self.source[arcs], self.cible[arcs]
+        nb_niveaux = int(niveau.max(initial=0)) + 1
+        bornes_arcs = np.searchsorted(niveau[dst], np.arange(nb_niveaux + 1))
+        bornes_noeuds = np.searchsorted(niveau[ordre], np.arange(nb_niveaux + 1))
+
+        tot = np.zeros(n, dtype=d.dtype)
+        tft = np.zeros(n, dtype=d.dtype)
+        for l in range(nb_niveaux):
+            a, b = bornes_arcs[l], bornes_arcs[l + 1]
+            np.maximum.at(tot, dst[a:b], tft[src[a:b]])
+            noeuds = ordre[bornes_noeuds[l]:bornes_noeuds[l + 1]]
+            tft[noeuds] = tot[noeuds] + d[noeuds]
+
+        tftard = np.full(n, tft[n - 1], dtype=d.dtype)
+        tard = np.zeros(n, dtype=d.dtype)
+        for l in range(nb_niveaux - 1, -1, -1):
+            noeuds = ordre[bornes_noeuds[l]:bornes_noeuds[l + 1]]
+            tard[noeuds] = tftard[noeuds] - d[noeuds]
+            a, b = bornes_arcs[l], bornes_arcs[l + 1]
+            np.minimum.at(tftard, src[a:b], tard[dst[a:b]])
+        return tot, tft, tard, tftard
+
+    def calculer_dates(self, moteur='auto'):
+        """
+        Dates au plus tôt / au plus tard et marges.
+
+        Args:
+            moteur (str): 'liste' (parcours de l'ordre topologique), 'niveaux' (NumPy par niveau)
+                ou 'auto' : 'niveaux' quand les niveaux sont peu nombreux par rapport aux tâches.
+
+        Returns:
+            dict: Tableaux 'tot', 'tft', 'tard', 'tftard', 'marge' (indexés comme `noms`).
+        """
+        ordre, niveau = self.ordre_topologique()
+        if moteur == 'auto':
+            moteur = 'niveaux' if (int(niveau.max(initial=0)) + 1) * 64 <= self.nb_taches else 'liste'
+        if moteur == 'niveaux':
+            tot, tft, tard, tftard = self._dates_niveaux(ordre, niveau)
+        elif moteur == 'liste':
+            tot, tft, tard, tftard = self._dates_liste(ordre)
+        else:
+            raise ValueError(f"Moteur CPM inconnu : '{moteur}' (attendu 'auto', 'liste' ou 'niveaux').")
+        return {'tot': tot, 'tft': tft, 'tard': tard, 'tftard': tftard, 'marge': tard - tot}
+
+    def vers_dictionnaire(self, dates):
+        """
+        Format historique de `algo_potentiel_metra` : {nom: {'duree', 'pred', 'succ', 'tot', 'tft',
+        'tard', 'tftard', 'marge'}}, tâches utilisateur d'abord, puis Début et Fin.
+        """
+        n = self.nb_taches
+        fin = n - 1
+        noms = np.asarray(self.noms, dtype=object)
+        succ_noms = noms[self.succ_cibles].tolist()
+        succ_offsets = self.succ_offsets.tolist()
+        preds_fin = noms[self.pred_sources[self.pred_offsets[fin]:]].tolist()
+        preds = [list(p) if p else [DEBUT] for p in self.preds_saisis]
+        preds[0], preds[fin] = [], preds_fin
+
+        ordre_sortie = [*range(1, fin), 0, fin]
+        colonnes = zip(
+            self.durees.tolist(), dates['tot'].tolist(), dates['tft'].tolist(),
+            dates['tard'].tolist(), dates['tftard'].tolist(), dates['marge'].tolist(),
+        )
+        lignes = list(colonnes)
+        taches = {}
+        for i in ordre_sortie:
+            duree, tot, tft, tard, tftard, marge = lignes[i]
+            taches[self.noms[i]] = {
+                'duree': duree, 'pred': preds[i], 'succ': succ_noms[succ_offsets[i]:succ_offsets[i + 1]],
+                'tot': tot, 'tft': tft, 'tard': tard, 'tftard': tftard, 'marge': marge,
+            }
+        return taches
@@ -0,0 +1,233 @@
+# algos/cpm_dynamique.py
+# Planning MPM maintenu sous changements de durées et de dépendances, sans relancer le calcul complet :
+# chaque modification ne repropage les dates que dans le cône des tâches concernées.
+import heapq
+import networkx as nx
+from algos.cpm import ReseauCPM
+
+
+class PlanningDynamique:
+    """
+    Planning potentiel-tâches dynamique.
+
+    Chaque nœud garde sa date au plus tôt `tot` et sa « queue » `reste` (plus long chemin
+    de son début jusqu'à la fin du projet, sa durée comprise) : tard = fin_projet - reste.
+    Les dates au plus tard ne dépendent donc de la fin du projet que par un décalage,
+    et les deux passes incrémentales sont indépendantes :
+      - avant : tas indexé par rang topologique, un nœud n'est réévalué que si un prédécesseur a bougé ;
+      - arrière : même principe sur les successeurs, en ordre topologique inverse.
+    L'ordre topologique est maintenu sous ajout d'arc par l'algorithme de Pearce-Kelly
+    (seule la zone entre les deux extrémités est réordonnée).
+
+    Comme dans `algos.mpm`, une tâche sans prédécesseur suit Début et une tâche sans successeur précède Fin ;
+    ces arcs sont ajoutés/retirés automatiquement. Chaque modification renvoie l'ensemble des noms
+    des tâches dont les dates (donc la marge ou la criticité) ont changé.
+    """
+
+    def __init__(self, taches_input):
+        reseau = ReseauCPM(taches_input)
+        dates = reseau.calculer_dates('liste')
+        ordre, _ = reseau.ordre_topologique()
+        n = reseau.nb_taches
+        self.noms = reseau.noms
+        self.index = reseau.index
+        self.fin = n - 1
+        self._duree = reseau.durees.tolist()
+        # Ensembles ordonnés (dict -> None) pour garder un affichage stable des prédécesseurs
+        self._preds = [dict() for _ in range(n)]
+        self._succs = [dict() for _ in range(n)]
+        for a, b in zip(reseau.source.tolist(), reseau.cible.tolist()):
+            self._succs[a][b] = None
+            self._preds[b][a] = None
+        self._rang = [0] * n
+        for r, x in enumerate(ordre.tolist()):
+            self._rang[x] = r
+        self._tot = dates['tot'].tolist()
+        fin_projet = self._tot[self.fin]
+        self._reste = [fin_projet - t for t in dates['tard'].tolist()]
+
+    # --- Accès ---
+
+    @property
+    def fin_projet(self):
+        return self._tot[self.fin]
+
+    def dates(self, nom):
+        """Dates d'une tâche : {'duree', 'tot', 'tft', 'tard', 'tftard', 'marge'}."""
+        x = self.index[nom]
+        d, tot = self._duree[x], self._tot[x]
+        tard = self.fin_projet - self._reste[x]
+        return {'duree': d, 'tot': tot, 'tft': tot + d, 'tard': tard, 'tftard': tard + d, 'marge': tard - tot}
+
+    def critiques(self):
+        """Noms des tâches de marge nulle, dans l'ordre topologique."""
+        fin_projet = self.fin_projet
+        return [self.noms[x] for x in sorted(range(len(self.noms)), key=self._rang.__getitem__)
+                if fin_projet - self._reste[x] == self._tot[x]]
+
+    def vers_dictionnaire(self):
+        """Même format que `algo_potentiel_metra` (tâches utilisateur, puis Début et Fin)."""
+        taches = {}
+        for x in [*range(1, self.fin), 0, self.fin]:
+            taches[self.noms[x]] = {
+                'pred': [self.noms[p] for p in self._preds[x]],
+                'succ': [self.noms[s] for s in self._succs[x]],
+                **self.dates(self.noms[x]),
+            }
+        return taches
+
+    # --- Outils internes ---
+
+    def _indice(self, nom):
+        x = self.index[nom]
+        if x == 0 or x == self.fin:
+            raise ValueError(f"'{nom}' est un jalon fixe : seules les tâches utilisateur sont modifiables.")
+        return x
+
+    def _lier(self, a, b, avant, arriere):
+        self._succs[a][b] = None
+        self._preds[b][a] = None
+        avant.add(b)
+        arriere.add(a)
+
+    def _delier(self, a, b, avant, arriere):
+        del self._succs[a][b]
+        del self._preds[b][a]
+        avant.add(b)
+        arriere.add(a)
+
+    def _reordonner(self, a, b):
+        """
+        Pearce-Kelly : l'arc a -> b viole l'ordre (rang[b] < rang[a]). On collecte les nœuds
+        atteignables depuis b avant rang[a], et ceux qui mènent à a après rang[b], puis on
+        redistribue leurs rangs (ceux menant à a d'abord).
+        """
+        rang = self._rang
+        bas, haut = rang[b], rang[a]
+        vers_avant = {b: None} # nœud -> nœud par lequel on l'a atteint (pour citer le cycle)
+        pile = [b]
+        while pile:
+            x = pile.pop()
+            for y in self._succs[x]:
+                if y == a:
+                    chemin = [a, x]
+                    while chemin[-1] != b:
+                        chemin.append(vers_avant[chemin[-1]])
+                    cycle = [a, *reversed(chemin)] # a -> b -> ... -> x -> a
+                    noms = " → ".join(self.noms[i] for i in cycle)
+                    raise nx.NetworkXUnfeasible(f"Cycle détecté dans les dépendances des tâches ({noms}). Impossible de calculer MPM.")
+                if y not in vers_avant and rang[y] < haut:
+                    vers_avant[y] = x
+                    pile.append(y)
+        vers_arriere = {a}
+        pile = [a]
+        while pile:
+            x = pile.pop()
+            for y in self._preds[x]:
+                if y not in vers_arriere and rang[y] > bas:
+                    vers_arriere.add(y)
+                    pile.append(y)
+        avant = sorted(vers_avant, key=rang.__getitem__)
+        arriere = sorted(vers_arriere, key=rang.__getitem__)
+        places = sorted(rang[x] for x in avant + arriere)
+        for x, r in zip(arriere + avant, places):
+            rang[x] = r
+
+    def _propager(self, avant, arriere, touches):
+        """Repropage tot (cône aval de `avant`) et reste (cône amont de `arriere`) ; complète `touches`."""
+        ancienne_fin = self.fin_projet
+        d, tot, reste, rang = self._duree, self._tot, self._reste, self._rang
+
+        tas = [(rang[x], x) for x in avant]
+        heapq.heapify(tas)
+        while tas:
+            _, x = heapq.heappop(tas)
+            if x not in avant:
+                continue # Déjà traité (entrée en double dans le tas)
+            avant.discard(x)
+            debut = max((tot[p] + d[p] for p in self._preds[x]), default=0)
+            if debut != tot[x]:
+                tot[x] = debut
+                touches.add(x)
+                for s in self._succs[x]:
+                    if s not in avant:
+                        avant.add(s)
+                        heapq.heappush(tas, (rang[s], s))
+
+        tas = [(-rang[x], x) for x in arriere]
+        heapq.heapify(tas)
+        while tas:
+            _, x = heapq.heappop(tas)
+            if x not in arriere:
+                continue
+            arriere.discard(x)
+            queue = d[x] + max((reste[s] for s in self._succs[x]), default=0)
+            if queue != reste[x]:
+                reste[x] = queue
+                touches.add(x)
+                for p in self._preds[x]:
+                    if p not in arriere:
+                        arriere.add(p)
+                        heapq.heappush(tas, (-rang[p], p))
+
+        if self.fin_projet != ancienne_fin:
+            return set(self.noms) # Toutes les dates au plus tard se décalent
+        return {self.noms[x] for x in touches}
+
+    # --- Modifications ---
+
+    def modifier_duree(self, nom, duree):
+        """
+        Change la durée d'une tâche.
+
+        Returns:
+            set: Noms des tâches dont les dates ont changé.
+        """
+        x = self._indice(nom)
+        if duree == self._duree[x]:
+            return set()
+        self._duree[x] = duree
+        return self._propager(set(self._succs[x]), {x}, {x})
+
+    def ajouter_dependance(self, pred, succ):
+        """
+        Ajoute la contrainte pred -> succ.
+
+        Returns:
+            set: Noms des tâches dont les dates ont changé.
+
+        Raises:
+            nx.NetworkXUnfeasible: Si la dépendance crée un cycle (le cycle est cité, rien n'est modifié).
+        """
+        a, b = self._indice(pred), self._indice(succ)
+        if b in self._succs[a]:
+            return set()
+        if a == b:
+            raise nx.NetworkXUnfeasible(f"Cycle détecté dans les dépendances des tâches ({pred} → {pred}). Impossible de calculer MPM.")
+        if self._rang[b] < self._rang[a]:
+            self._reordonner(a, b)
+        avant, arriere = set(), set()
+        self._lier(a, b, avant, arriere)
+        if 0 in self._preds[b]:
+            self._delier(0, b, avant, arriere)
+        if self.fin in self._succs[a]:
+            self._delier(a, self.fin, avant, arriere)
+        return self._propager(avant, arriere, set())
+
+    def retirer_dependance(self, pred, succ):
+        """
+        Retire la contrainte pred -> succ (l'ordre topologique reste valide).
+
+        Returns:
+            set: Noms des tâches dont les dates ont changé.
+        """
+        a, b = self._indice(pred), self._indice(succ)
+        if b not in self._succs[a]:
+            raise KeyError((pred, succ))
+        avant, arriere = set(), set()
+        self._delier(a, b, avant, arriere)
+        if not self._preds[b]:
+            self._lier(0, b, avant, arriere)
+        if not self._succs[a]:
+            self._lier(a, self.fin, avant, arriere)
+        return self._propager(avant, arriere, set())
@@ -0,0 +1,287 @@
+# algos/flot.py
+# Moteurs de flot maximal sur GrapheCompact : Dinic et push-relabel HLPP (plus haute étiquette).
+# Le graphe résiduel est un tableau d'arcs : l'arête e donne l'arc 2e (u -> v) et son
+# inverse 2e+1 (v -> u) ; l'inverse d'un arc a est donc a ^ 1.
+from collections import deque
+import numpy as np
+
+
+def _reseau_residuel(graphe):
+    """
+    Construit le réseau résiduel d'un graphe compact.
+
+    Returns:
+        tuple: (tete, cap, debut, arcs)
+            tete (list): Nœud d'arrivée de chaque arc résiduel.
+            cap (list): Capacité résiduelle de chaque arc (modifiée en place par les moteurs).
+            debut (list): arcs[debut[x]:debut[x+1]] sont les arcs résiduels sortant de x.
+            arcs (list): Identifiants des arcs, regroupés par nœud de départ.
+    """
+    n, m = graphe.nb_noeuds, graphe.nb_aretes
+    queue_arc = np.empty(2 * m, dtype=np.int64)
+    tete = np.empty(2 * m, dtype=np.int64)
+    queue_arc[0::2], queue_arc[1::2] = graphe.u, graphe.v
+    tete[0::2], tete[1::2] = graphe.v, graphe.u
+    cap = np.zeros(2 * m, dtype=graphe.poids.dtype if m else np.int64)
+    cap[0::2] = graphe.poids
+    if not graphe.oriente: # Arête non orientée : la capacité vaut dans les deux sens
+        cap[1::2] = graphe.poids
+    arcs = np.argsort(queue_arc, kind='stable')
+    debut = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(queue_arc, minlength=n), out=debut[1:])
+    return tete.tolist(), cap.tolist(), debut.tolist(), arcs.tolist()
+
+
+def _atteignables(n, tete, cap, debut, arcs, s):
+    """Nœuds atteignables depuis s dans le réseau résiduel (parcours en largeur)."""
+    vus = [False] * n
+    vus[s] = True
+    file = deque([s])
+    while file:
+        x = file.popleft()
+        for k in range(debut[x], debut[x + 1]):
+            a = arcs[k]
+            y = tete[a]
+            if cap[a] > 0 and not vus[y]:
+                vus[y] = True
+                file.append(y)
+    return vus
+
+
+def _dinic(n, tete, cap, debut, arcs, s, t):
+    """Dinic : graphes de niveaux + flots bloquants par DFS itératif avec pointeurs d'arc courant."""
+    flot = 0
+    while True:
+        niveau = [-1] * n
+        niveau[s] = 0
+        file = deque([s])
+        while file:
+            x = file.popleft()
+            for k in range(debut[x], debut[x + 1]):
+                a = arcs[k]
+                y = tete[a]
+                if cap[a] > 0 and niveau[y] < 0:
+                    niveau[y] = niveau[x] + 1
+                    file.append(y)
+        if niveau[t] < 0:
+            return flot, [niveau[x] >= 0 for x in range(n)]
+
+        courant = debut[:] # Pointeur d'arc courant de chaque nœud
+        pile = [] # Arcs du chemin en cours depuis s
+        x = s
+        while True:
+            if x == t:
+                delta = min(cap[a] for a in pile)
+                for a in pile:
+                    cap[a] -= delta
+                    cap[a ^ 1] += delta
+                flot += delta
+                # Repartir de la queue du premier arc saturé
+                k = 0
+                while cap[pile[k]] > 0:
+                    k += 1
+                del pile[k:]
+                x = tete[pile[-1]] if pile else s
+                continue
+            avance = False
+            fin = debut[x + 1]
+            while courant[x] < fin:
+                a = arcs[courant[x]]
+                y = tete[a]
+                if cap[a] > 0 and niveau[y] == niveau[x] + 1:
+                    pile.append(a)
+                    x = y
+                    avance = True
+                    break
+                courant[x] += 1
+            if not avance:
+                if x == s:
+                    break # Flot bloquant atteint
+                niveau[x] = -1 # Impasse : x ne sert plus dans cette phase
+                a = pile.pop()
+                x = tete[a ^ 1]
+                courant[x] += 1
+
+
+def _hauteurs_exactes(n, tete, cap, debut, arcs, s, t):
+    """
+    Réétiquetage global : distance résiduelle jusqu'à t, ou n + distance jusqu'à s
+    pour les nœuds qui ne peuvent plus atteindre t (2n s'ils n'atteignent aucun des deux).
+    """
+    hauteur = [2 * n] * n
+    for racine, base in ((t, 0), (s, n)):
+        hauteur[racine] = base
+        file = deque([racine])
+        while file:
+            x = file.popleft()
+            for k in range(debut[x], debut[x + 1]):
+                a = arcs[k]
+                y = tete[a]
+                # y peut pousser vers x si l'arc inverse (y -> x) a de la capacité
+                if cap[a ^ 1] > 0 and hauteur[y] == 2 * n and y != s and y != t:
+                    hauteur[y] = hauteur[x] + 1
+                    file.append(y)
+    return hauteur
+
+
+def _hlpp(n, tete, cap, debut, arcs, s, t):
+    """
+    Push-relabel à plus haute étiquette (HLPP) avec heuristique de trou et réétiquetage
+    global périodique. Les hauteurs montent jusqu'à 2n, ce qui renvoie l'excès inutile
+    vers s : le résultat est un vrai flot, pas seulement un préflot.
+    """
+    exces = [0] * n
+    for k in range(debut[s], debut[s + 1]):
+        a = arcs[k]
+        if cap[a] > 0:
+            y = tete[a]
+            exces[y] += cap[a]
+            exces[s] -= cap[a]
+            cap[a ^ 1] += cap[a]
+            cap[a] = 0
+
+    paniers = [[] for _ in range(2 * n + 1)] # Nœuds actifs par hauteur
+    actif = [False] * n
+    hauteur = []
+    effectif = []
+    courant = []
+    haut = 0
+
+    def reetiqueter_tout():
+        nonlocal hauteur, effectif, courant, haut
+        hauteur = _hauteurs_exactes(n, tete, cap, debut, arcs, s, t)
+        hauteur[s] = n
+        effectif = [0] * (2 * n + 1)
+        for h in hauteur:
+            effectif[h] += 1
+        courant = debut[:]
+        for panier in paniers:
+            panier.clear()
+        haut = 0
+        for x in range(n):
+            actif[x] = False
+            if x != s and x != t and exces[x] > 0 and hauteur[x] < 2 * n:
+                actif[x] = True
+                paniers[hauteur[x]].append(x)
+                haut = max(haut, hauteur[x])
+
+    reetiqueter_tout()
+    reetiquetages = 0
+    while True:
+        while haut >= 0 and not paniers[haut]:
+            haut -= 1
+        if haut < 0:
+            break
+        x = paniers[haut].pop()
+        if hauteur[x] != haut: # Déplacé par un trou : reclasser
+            paniers[hauteur[x]].append(x)
+            haut = max(haut, hauteur[x])
+            continue
+        actif[x] = False
+
+        # Décharge de x
+        while exces[x] > 0:
+            fin = debut[x + 1]
+            while courant[x] < fin and exces[x] > 0:
+                a = arcs[courant[x]]
+                y = tete[a]
+                if cap[a] > 0 and hauteur[x] == hauteur[y] + 1:
+                    delta = min(exces[x], cap[a])
+                    cap[a] -= delta
+                    cap[a ^ 1] += delta
+                    exces[x] -= delta
+                    exces[y] += delta
+                    if y != s and y != t and not actif[y]:
+                        actif[y] = True
+                        paniers[hauteur[y]].append(y)
+                        haut = max(haut, hauteur[y])
+                    if cap[a] == 0:
+                        courant[x] += 1
+                else:
+                    courant[x] += 1
+            if exces[x] == 0:
+                break
+
+            # Réétiquetage de x
+            ancienne = hauteur[x]
+            nouvelle = 2 * n
+            for k in range(debut[x], debut[x + 1]):
+                a = arcs[k]
+                if cap[a] > 0:
+                    nouvelle = min(nouvelle, hauteur[tete[a]] + 1)
+            effectif[ancienne] -= 1
+            hauteur[x] = nouvelle
+            effectif[nouvelle] += 1
+            courant[x] = debut[x]
+            reetiquetages += 1
+            if effectif[ancienne] == 0 and ancienne < n:
+                # Trou : les nœuds au-dessus ne peuvent plus atteindre t
+                for y in range(n):
+                    if ancienne < hauteur[y] < n and y != s:
+                        effectif[hauteur[y]] -= 1
+                        hauteur[y] = n + 1
+                        effectif[n + 1] += 1
+                        courant[y] = debut[y]
+            if hauteur[x] >= 2 * n:
+                break
+            if reetiquetages >= n:
+                reetiquetages = 0
+                reetiqueter_tout()
+                break
+        if exces[x] > 0 and not actif[x] and hauteur[x] < 2 * n:
+            actif[x] = True
+            paniers[hauteur[x]].append(x)
+            haut = max(haut, hauteur[x])
+
+    return exces[t], _atteignables(n, tete, cap, debut, arcs, s)
+
+
+def flot_maximal(graphe, source, puits, methode='dinic'):
+    """
+    Flot maximal de `source` à `puits` sur un graphe compact (poids = capacités).
+
+    Args:
+        graphe (GrapheCompact): Graphe orienté (ou non orienté) avec capacités entières.
+        source (int): Indice du nœud source.
+        puits (int): Indice du nœud puits.
+        methode (str): 'dinic' ou 'hlpp' (push-relabel à plus haute étiquette).
+
+    Returns:
+        tuple: (valeur, flots, atteignables)
+            valeur: Valeur du flot maximal.
+            flots (np.ndarray): Flot sur chaque arête (négatif = sens v -> u pour une arête non orientée).
+            atteignables (np.ndarray): Booléens, nœuds atteignables depuis la source dans le résiduel final.
+    """
+    if source == puits:
+        raise ValueError("La source et le puits doivent être différents.")
+    n = graphe.nb_noeuds
+    tete, cap, debut, arcs = _reseau_residuel(graphe)
+    if methode == 'dinic':
+        valeur, atteignables = _dinic(n, tete, cap, debut, arcs, source, puits)
+    elif methode == 'hlpp':
+        valeur, atteignables = _hlpp(n, tete, cap, debut, arcs, source, puits)
+    else:
+        raise ValueError(f"Méthode de flot inconnue : '{methode}' (attendu 'dinic' ou 'hlpp').")
+    flots = graphe.poids - np.asarray(cap[0::2], dtype=graphe.poids.dtype) if graphe.nb_aretes else np.zeros(0, dtype=np.int64)
+    return valeur, flots, np.asarray(atteignables, dtype=bool)
+
+
+def coupe_minimale(graphe, atteignables):
+    """
+    Coupe minimale déduite du résiduel final d'un flot maximal (aucun second calcul de flot).
+
+    Args:
+        graphe (GrapheCompact): Graphe sur lequel le flot a été calculé.
+        atteignables (np.ndarray): Booléens renvoyés par `flot_maximal`.
+
+    Returns:
+        tuple: (cote_source, cote_puits, aretes_coupe)
+            cote_source (np.ndarray): Indices des nœuds du côté S.
+            cote_puits (np.ndarray): Indices des nœuds du côté T.
+            aretes_coupe (np.ndarray): Indices des arêtes (saturées) allant de S vers T.
+    """
+    atteignables = np.asarray(atteignables, dtype=bool)
+    traverse = atteignables[graphe.u] & ~atteignables[graphe.v]
+    if not graphe.oriente:
+        traverse |= atteignables[graphe.v] & ~atteignables[graphe.u]
+    return np.flatnonzero(atteignables), np.flatnonzero(~atteignables), np.flatnonzero(traverse)
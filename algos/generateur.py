@@ -0,0 +1,108 @@
+# algos/generateur.py
+import random
+import numpy as np
+
+
+def nombre_paires(n):
+    """Nombre de paires non orientées {u, v} (u != v) pour n nœuds."""
+    return n * (n - 1) // 2 if n > 1 else 0
+
+
+def rng_par_defaut(rng):
+    """
+    Générateur NumPy à utiliser : `rng` s'il est fourni, sinon un générateur dérivé du module `random`
+    (random.seed() reste donc valable pour les graphes générés et les colorations aléatoires).
+    """
+    return rng if rng is not None else np.random.default_rng(random.getrandbits(64))
+
+
+def decoder_paires(k):
+    """
+    Décode des indices de paires en (u, v) avec u < v, sans énumérer les paires.
+    L'indice k correspond à la paire k = v*(v-1)/2 + u (ordre par plus grande extrémité).
+
+    Args:
+        k (np.ndarray): Indices de paires (entiers >= 0).
+
+    Returns:
+        tuple: (u, v) tableaux int64.
+    """
+    k = np.asarray(k, dtype=np.int64)
+    v = ((1 + np.sqrt(8 * k.astype(np.float64) + 1)) / 2).astype(np.int64)
+    # Corriger l'arrondi flottant pour les très grands indices
+    v -= (v * (v - 1) // 2 > k)
+    v += ((v + 1) * v // 2 <= k)
+    u = k - v * (v - 1) // 2
+    return u, v
+
+
+def echantillonner_paires(n, nb_aretes, rng=None):
+    """
+    Tire `nb_aretes` paires distinctes parmi les n(n-1)/2 possibles.
+    La mémoire utilisée est proportionnelle à `nb_aretes`, pas au nombre de paires possibles.
+
+    Returns:
+        tuple: (u, v) tableaux int64 avec u < v.
+    """
+    rng = rng_par_defaut(rng)
+    total = nombre_paires(n)
+    nb_aretes = min(int(nb_aretes), total)
+    if nb_aretes <= 0:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+    k = rng.choice(total, size=nb_aretes, replace=False)
+    return decoder_paires(k)
+
+
+def paires_gnp(n, p, rng=None):
+    """
+    Graphe aléatoire G(n, p) par sauts géométriques : chaque paire est retenue avec
+    probabilité p, en O(n + m) sans parcourir les paires rejetées.
+
+    Returns:
+        tuple: (u, v) tableaux int64 avec u < v.
+    """
+    rng = rng_par_defaut(rng)
+    total = nombre_paires(n)
+    if total == 0 or p <= 0:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+    if p >= 1:
+        return decoder_paires(np.arange(total, dtype=np.int64))
+
+    blocs = []
+    position = -1 # Dernier indice retenu
+    taille_bloc = max(16, int(total * p * 1.1) + 16)
+    while position < total - 1:
+        sauts = rng.geometric(p, size=taille_bloc)
+        indices = position + np.cumsum(sauts)
+        indices = indices[indices < total]
+        if len(indices):
+            blocs.append(indices)
+            position = int(indices[-1])
+        if len(indices) < taille_bloc:
+            break
+    k = np.concatenate(blocs) if blocs else np.empty(0, dtype=np.int64)
+    return decoder_paires(k)
+
+
+def generer_aretes(n, nb_aretes, valeurs=(1, 200), oriente=False, rng=None):
+    """
+    Génère `nb_aretes` arêtes aléatoires distinctes (sans boucle ni arête inverse)
+    avec des poids/capacités entiers uniformes dans `valeurs` (bornes incluses).
+
+    Args:
+        n (int): Nombre de nœuds.
+        nb_aretes (int): Nombre d'arêtes souhaité (borné par n(n-1)/2).
+        valeurs (tuple): (min, max) des poids ou capacités.
+        oriente (bool): Si True, chaque arête reçoit une direction aléatoire.
+        rng (np.random.Generator): Générateur NumPy (optionnel).
+
+    Returns:
+        tuple: (u, v, valeurs) tableaux NumPy.
+    """
+    rng = rng_par_defaut(rng)
+    u, v = echantillonner_paires(n, nb_aretes, rng)
+    if oriente and len(u):
+        inverser = rng.random(len(u)) < 0.5
+        u, v = np.where(inverser, v, u), np.where(inverser, u, v)
+    poids = rng.integers(valeurs[0], valeurs[1] + 1, size=len(u))
+    return u, v, poids
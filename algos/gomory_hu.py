@@ -0,0 +1,133 @@
+# algos/gomory_hu.py
+# Arbre de Gomory-Hu (algorithme de Gusfield) : n-1 calculs de flot sur un même graphe non orienté
+# suffisent pour connaître la coupe minimale entre toutes les paires de nœuds.
+import numpy as np
+from algos.graphe import GrapheCompact
+from algos.flot import flot_maximal
+
+INFINI = np.iinfo(np.int64).max
+
+
+class ArbreGomoryHu:
+    """
+    Arbre de Gomory-Hu enraciné en 0 : l'arête (i, parent[i]) a la capacité capacite[i].
+    La coupe minimale entre s et t est l'arête de plus petite capacité sur le chemin s-t de l'arbre.
+    Les requêtes passent par un index de remontée binaire (ancêtre et minimum à 2^k niveaux),
+    soit O(log n) par paire.
+    """
+
+    def __init__(self, parent, capacite, noms):
+        self.parent = np.asarray(parent, dtype=np.int64)
+        self.capacite = np.asarray(capacite, dtype=np.int64)
+        self.noms = list(noms)
+        self.index = {nom: i for i, nom in enumerate(self.noms)}
+        n = len(self.parent)
+
+        # Profondeurs par parcours depuis la racine (les parents n'ont pas forcément un indice plus petit)
+        enfants = [[] for _ in range(n)]
+        for i in range(1, n):
+            enfants[self.parent[i]].append(i)
+        self.profondeur = np.zeros(n, dtype=np.int64)
+        pile = [0] if n else []
+        while pile:
+            x = pile.pop()
+            for y in enfants[x]:
+                self.profondeur[y] = self.profondeur[x] + 1
+                pile.append(y)
+
+        # Tables de remontée : ancetre[k][x] = ancêtre à 2^k niveaux, minimum[k][x] = capacité min sur ce trajet
+        ancetre = self.parent.copy()
+        minimum = self.capacite.copy()
+        if n:
+            minimum[0] = INFINI
+        self._ancetres, self._minimums = [ancetre], [minimum]
+        for _ in range(max(int(self.profondeur.max(initial=0)).bit_length() - 1, 0)):
+            ancetre, minimum = ancetre[ancetre], np.minimum(minimum, minimum[ancetre])
+            self._ancetres.append(ancetre)
+            self._minimums.append(minimum)
+
+    def coupe_min(self, s, t):
+        """Valeur de la coupe minimale entre les nœuds d'indices s et t (s != t)."""
+        if s == t:
+            raise ValueError("Les deux nœuds doivent être différents.")
+        resultat = INFINI
+        if self.profondeur[s] < self.profondeur[t]:
+            s, t = t, s
+        ecart = int(self.profondeur[s] - self.profondeur[t])
+        k = 0
+        while ecart:
+            if ecart & 1:
+                resultat = min(resultat, int(self._minimums[k][s]))
+                s = int(self._ancetres[k][s])
+            ecart >>= 1
+            k += 1
+        if s == t:
+            return resultat
+        for k in range(len(self._ancetres) - 1, -1, -1):
+            if self._ancetres[k][s] != self._ancetres[k][t]:
+                resultat = min(resultat, int(self._minimums[k][s]), int(self._minimums[k][t]))
+                s, t = int(self._ancetres[k][s]), int(self._ancetres[k][t])
+        return min(resultat, int(self.capacite[s]), int(self.capacite[t]))
+
+    def coupe_min_noms(self, nom_s, nom_t):
+        """Comme `coupe_min`, avec les noms des nœuds (KeyError si un nom est inconnu)."""
+        return self.coupe_min(self.index[nom_s], self.index[nom_t])
+
+    def aretes(self):
+        """Arêtes de l'arbre : liste de (nom_enfant, nom_parent, capacité)."""
+        return [(self.noms[i], self.noms[self.parent[i]], int(self.capacite[i])) for i in range(1, len(self.parent))]
+
+    def matrice(self):
+        """
+        Matrice n x n des coupes minimales (diagonale à 0), remplie en O(n²) :
+        les arêtes de l'arbre sont fusionnées par capacité décroissante (comme Kruskal),
+        et chaque fusion fixe la valeur de toutes les paires entre les deux composantes.
+        """
+        n = len(self.parent)
+        M = np.zeros((n, n), dtype=np.int64)
+        membres = {i: [i] for i in range(n)}
+        composante = list(range(n))
+        for i in np.argsort(-self.capacite[1:], kind='stable') + 1:
+            a, b = composante[i], composante[self.parent[i]]
+            if len(membres[a]) < len(membres[b]):
+                a, b = b, a
+            A, B = membres[a], membres.pop(b)
+            M[np.ix_(A, B)] = self.capacite[i]
+            M[np.ix_(B, A)] = self.capacite[i]
+            for x in B:
+                composante[x] = a
+            A.extend(B)
+        return M
+
+
+def arbre_gomory_hu(graphe, methode='dinic'):
+    """
+    Construit l'arbre de Gomory-Hu d'un graphe par l'algorithme de Gusfield (n-1 flots maximaux,
+    sans contraction de nœuds). Un graphe orienté est traité comme non orienté : la coupe
+    d'une paire est alors la capacité totale des liens à couper, quel que soit leur sens.
+
+    Args:
+        graphe (GrapheCompact): Graphe avec capacités (poids).
+        methode (str): Moteur de flot ('dinic' ou 'hlpp').
+
+    Returns:
+        ArbreGomoryHu: Arbre avec son index de requêtes.
+    """
+    if graphe.oriente:
+        graphe = GrapheCompact(graphe.nb_noeuds, graphe.u, graphe.v, graphe.poids, oriente=False, attribut=graphe.attribut)
+    n = graphe.nb_noeuds
+    parent = [0] * n
+    capacite = [0] * n
+    for s in range(1, n):
+        t = parent[s]
+        valeur, _, cote_s = flot_maximal(graphe, s, t, methode=methode)
+        capacite[s] = valeur
+        for i in range(n):
+            if i != s and cote_s[i] and parent[i] == t:
+                parent[i] = s
+        if cote_s[parent[t]]: # Le parent de t est du côté de s : s s'intercale entre t et son parent
+            parent[s] = parent[t]
+            parent[t] = s
+            capacite[s] = capacite[t]
+            capacite[t] = valeur
+    return ArbreGomoryHu(parent, capacite, graphe.noms)
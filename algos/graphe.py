@@ -0,0 +1,98 @@
+# algos/graphe.py
+import numpy as np
+import networkx as nx
+from algos.noms import noms_depuis_indices, nom_vers_index
+
+
+class GrapheCompact:
+    """
+    Graphe compact partagé par les modules de `algos` (format CSR).
+
+    Les nœuds sont des entiers 0..n-1 ; `noms` est la table des noms affichés.
+    Si `noms` est un entier n, les noms sont ceux du codec de `algos.noms`
+    (A, B, ..., AA, ...) : ils ne sont matérialisés qu'à la demande, et
+    `index()` les décode directement sans table de hachage.
+    Les arêtes sont gardées deux fois :
+      - en liste (`u`, `v`, `poids`), une entrée par arête, pour les algorithmes
+        qui parcourent les arêtes (Bellman-Ford, Kruskal, ...) ;
+      - en CSR (`offsets`, `cibles`, `poids_csr`, `id_arete`) pour les parcours
+        de voisinage : les voisins de i sont cibles[offsets[i]:offsets[i+1]].
+    Pour un graphe non orienté, chaque arête apparaît dans le CSR des deux extrémités.
+    """
+
+    def __init__(self, noms, u, v, poids, oriente=False, attribut='weight'):
+        if isinstance(noms, int):
+            self._nb_noeuds, self._noms, self._codec = noms, None, True
+        else:
+            self._noms = list(noms)
+            self._nb_noeuds, self._codec = len(self._noms), False
+        self.oriente = oriente
+        self.attribut = attribut # Nom de l'attribut networkx ('weight', 'capacity', ...)
+        self.u = np.asarray(u, dtype=np.int64)
+        self.v = np.asarray(v, dtype=np.int64)
+        self.poids = np.asarray(poids)
+        self._index = None
+
+        n = self._nb_noeuds
+        ids = np.arange(len(self.u), dtype=np.int64)
+        if oriente:
+            src, dst, id_csr = self.u, self.v, ids
+        else:
+            src = np.concatenate((self.u, self.v))
+            dst = np.concatenate((self.v, self.u))
+            id_csr = np.concatenate((ids, ids))
+        ordre = np.argsort(src, kind='stable')
+        self.cibles = dst[ordre]
+        self.id_arete = id_csr[ordre]
+        self.poids_csr = self.poids[self.id_arete] if len(self.poids) else self.poids
+        self.offsets = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(src, minlength=n), out=self.offsets[1:])
+
+    @property
+    def noms(self):
+        """Table des noms (indice -> nom)."""
+        if self._noms is None:
+            self._noms = noms_depuis_indices(np.arange(self._nb_noeuds))
+        return self._noms
+
+    @property
+    def nb_noeuds(self):
+        return self._nb_noeuds
+
+    @property
+    def nb_aretes(self):
+        return len(self.u)
+
+    def degres(self):
+        """Degré (sortant si orienté) de chaque nœud."""
+        return np.diff(self.offsets)
+
+    def index(self, nom):
+        """Indice entier du nœud `nom` (KeyError si inconnu)."""
+        if self._codec:
+            try:
+                i = nom_vers_index(nom)
+            except ValueError:
+                raise KeyError(nom)
+            if not 0 <= i < self._nb_noeuds:
+                raise KeyError(nom)
+            return i
+        if self._index is None:
+            self._index = {nom_i: i for i, nom_i in enumerate(self.noms)}
+        return self._index[nom]
+
+    def voisins(self, i):
+        """(cibles, poids) des arcs sortants du nœud i."""
+        debut, fin = self.offsets[i], self.offsets[i + 1]
+        return self.cibles[debut:fin], self.poids_csr[debut:fin]
+
+    def vers_networkx(self):
+        """Conversion en Graph/DiGraph networkx, réservée au dessin."""
+        G = nx.DiGraph() if self.oriente else nx.Graph()
+        G.add_nodes_from(self.noms)
+        noms = self.noms
+        G.add_edges_from(
+            (noms[a], noms[b], {self.attribut: p})
+            for a, b, p in zip(self.u.tolist(), self.v.tolist(), self.poids.tolist())
+        )
+        return G
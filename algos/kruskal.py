@@ -1,44 +1,25 @@
 # algos/kruskal.py
 import networkx as nx
 import random
-import string
-from itertools import combinations, product as iterprod # Utiliser product renommé
+from algos.graphe import GrapheCompact
+from algos.arbre_couvrant import foret_couvrante_minimale, poids_par_composante
+from algos.generateur import generer_aretes, nombre_paires
+from algos.noms import index_vers_nom
 
-# Utiliser la version robuste de generer_noms_alphabétiques
-def generer_noms_alphabétiques_robuste(n):
-    noms = []
-    alphabet = string.ascii_uppercase
-    num_chars = 1
-    while len(noms) < n:
-        for p in iterprod(alphabet, repeat=num_chars): # Utiliser iterprod
-            if len(noms) < n:
-                noms.append("".join(p))
-            else:
-                break
-        if len(noms) >= n:
-            break
-        num_chars += 1
-    return noms
-
-def kruskal(n):
+def kruskal(n, moteur='auto'):
     if n <= 0:
         # total_weight, mst, G, densite_reelle_pourcentage
         return 0, nx.Graph(), nx.Graph(), 0.0 
 
-    G = nx.Graph() # Kruskal fonctionne sur des graphes non orientés
-    nodes = generer_noms_alphabétiques_robuste(n)
-    G.add_nodes_from(nodes)
-
     if n == 1: # Cas d'un seul nœud
+        G = nx.Graph(); G.add_node(index_vers_nom(0))
         return 0, nx.Graph(), G, 0.0 # Pas d'arêtes, donc 0% de densité d'arêtes
 
     # Facteur de densité cible pour la génération
     densite_cible_factor = random.uniform(0.05, 1.0) # Viser au moins une petite densité si n > 1
     
-    all_possible_edges_list = list(combinations(nodes, 2))
-    max_possible_edges_count = len(all_possible_edges_list)
-
-    edges_added_count = 0 # Pour compter les arêtes effectivement ajoutées
+    max_possible_edges_count = nombre_paires(n)
+    num_edges_to_generate = 0
 
     # --- MODIFICATION ICI pour N=2 et N>2 ---
     if n == 2:
@@ -46,56 +27,45 @@ def kruskal(n):
         # Probabilité d'avoir cette arête = densite_cible_factor.
         if max_possible_edges_count == 1: # Devrait toujours être vrai pour N=2
             if random.random() < densite_cible_factor:
-                u, v = all_possible_edges_list[0] # Prendre l'unique paire possible
-                poids = random.randint(1, 200)
-                G.add_edge(u, v, weight=poids)
-                edges_added_count = 1
-        # else: edges_added_count restera 0
+                num_edges_to_generate = 1 # L'unique paire possible
+        # else: aucune arête
     elif n > 2:
-        num_edges_to_generate = 0
         if max_possible_edges_count > 0:
             num_edges_to_generate_float = densite_cible_factor * max_possible_edges_count
             num_edges_to_generate = round(num_edges_to_generate_float)
             if num_edges_to_generate == 0 and num_edges_to_generate_float > 0.01: # Au moins une
                 num_edges_to_generate = 1
             num_edges_to_generate = min(int(num_edges_to_generate), max_possible_edges_count)
-
-        if num_edges_to_generate > 0 : # S'assurer qu'on a des arêtes à échantillonner
-            selected_edges_tuples = random.sample(all_possible_edges_list, num_edges_to_generate)
-            for u, v in selected_edges_tuples:
-                poids = random.randint(1, 200)
-                G.add_edge(u, v, weight=poids)
-            edges_added_count = G.number_of_edges() # ou num_edges_to_generate
     # --- FIN MODIFICATION ---
-    
-    # Calcul de l'arbre couvrant minimal
-    mst = nx.Graph() 
-    total_weight = 0
-    # Kruskal peut être appliqué à un graphe non connexe; il produit une forêt couvrante minimale.
-    # nx.minimum_spanning_tree retournera un arbre si connexe, ou lèvera une exception si pas d'option pour `algorithm='kruskal'` 
-    # si on veut juste les arêtes, nx.minimum_spanning_edges est plus direct.
-    try:
-        if G.number_of_edges() > 0 : # Un MST n'a de sens que s'il y a des arêtes
-            # Pour un graphe potentiellement non connexe, on trouve une forêt couvrante.
-            # Si on veut un seul arbre, on vérifie d'abord la connexité.
-            if nx.is_connected(G):
-                mst_edges = list(nx.minimum_spanning_edges(G, algorithm='kruskal', data=True))
-                if mst_edges:
-                    mst.add_nodes_from(G.nodes()) # S'assurer que tous les noeuds originaux sont dans mst même s'ils sont isolés dans l'MST final (forêt)
-                    mst.add_edges_from(mst_edges)
-                    total_weight = sum(d['weight'] for _, _, d in mst.edges(data=True))
-            # else: Le graphe n'est pas connexe. mst reste vide et total_weight=0 comme initialisé.
-            # On pourrait aussi choisir de calculer une forêt couvrante minimale:
-            # else:
-            #     forest_edges = list(nx.minimum_spanning_edges(G, algorithm='kruskal', data=True))
-            #     if forest_edges:
-            #         mst.add_nodes_from(G.nodes())
-            #         mst.add_edges_from(forest_edges) # mst serait alors une forêt
-            #         total_weight = sum(d['weight'] for _, _, d in mst.edges(data=True))
-    except Exception as e_kruskal_mst:
-        print(f"Erreur Kruskal MST: {e_kruskal_mst}")
-        # mst et total_weight restent à leurs valeurs initiales (vide/0)
 
+    # Tirage direct des indices de paires (aucune liste des N(N-1)/2 paires n'est construite)
+    aretes_u, aretes_v, aretes_poids = generer_aretes(n, num_edges_to_generate, valeurs=(1, 200))
+
+    graphe = GrapheCompact(n, aretes_u, aretes_v, aretes_poids, oriente=False, attribut='weight')
+    edges_added_count = graphe.nb_aretes
+    G = graphe.vers_networkx()
+
+    # Forêt couvrante minimale (un arbre par composante connexe) : le graphe non connexe
+    # donne donc une forêt et son poids, au lieu d'un arbre vide.
+    # moteur='auto' choisit Kruskal, Prim (graphe dense) ou Borůvka (grand graphe) selon la densité.
+    aretes, composantes, nb_composantes, moteur_utilise = foret_couvrante_minimale(graphe, moteur)
+    noms = graphe.noms
+    mst = nx.Graph()
+    mst.add_nodes_from(noms)
+    mst.add_edges_from(
+        (noms[a], noms[b], {'weight': p})
+        for a, b, p in zip(graphe.u[aretes].tolist(), graphe.v[aretes].tolist(), graphe.poids[aretes].tolist())
+    )
+    total_weight = int(graphe.poids[aretes].sum())
+
+    # Détail de la forêt pour l'affichage : (nœuds, poids) de chaque composante
+    poids_composantes = poids_par_composante(graphe, aretes, composantes, nb_composantes).tolist()
+    membres = [[] for _ in range(nb_composantes)]
+    for nom, c in zip(noms, composantes.tolist()):
+        membres[c].append(nom)
+    mst.graph['moteur'] = moteur_utilise
+    mst.graph['nb_composantes'] = nb_composantes
+    mst.graph['composantes'] = list(zip(membres, poids_composantes))
 
     # --- Calcul de la DENSITÉ RÉELLE du graphe G généré ---
     densite_reelle_pourcentage = 0.0
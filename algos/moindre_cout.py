@@ -19,32 +19,39 @@ def moindre_cout(offres, demandes, couts):
     
     n, m = len(offres), len(demandes)
     solution = np.zeros((n, m), dtype=int)
+    couts_np = np.asarray(couts)
 
     # Copie des données pour ne pas modifier les originales
-    offres_restantes = offres.copy()
-    demandes_restantes = demandes.copy()
+    offres_restantes = list(offres)
+    demandes_restantes = list(demandes)
+    reste = sum(offres_restantes)
     cout_total = 0
 
-    # Liste des cellules traitables (non saturées)
-    while sum(offres_restantes) > 0 and sum(demandes_restantes) > 0:
-        min_cout = float('inf')
-        i_min = j_min = -1
-
-        # Trouver la cellule à coût minimum
-        for i in range(n):
-            for j in range(m):
-                if offres_restantes[i] > 0 and demandes_restantes[j] > 0:
-                    if couts[i][j] < min_cout:
-                        min_cout = couts[i][j]
-                        i_min, j_min = i, j
-
-        if i_min == -1 or j_min == -1:
-            break  # aucune cellule valide trouvée
-        
-        quantite = min(offres_restantes[i_min], demandes_restantes[j_min])
-        solution[i_min][j_min] = quantite
-        cout_total += quantite * couts[i_min][j_min]
-        offres_restantes[i_min] -= quantite
-        demandes_restantes[j_min] -= quantite
+    # Un seul tri des cellules par coût (stable : à coût égal, ordre ligne par ligne comme un balayage),
+    # puis parcours en sautant les cellules dont la ligne ou la colonne est épuisée.
+    ordre = np.argsort(couts_np, axis=None, kind='stable')
+    ligne_vivante = np.array([o > 0 for o in offres_restantes] or [False])
+    colonne_vivante = np.array([d > 0 for d in demandes_restantes] or [False])
+    bloc = max(m, n, 1024)
+    for debut in range(0, n * m, bloc):
+        if reste <= 0:
+            break
+        cellules = ordre[debut:debut + bloc]
+        lignes, colonnes = np.divmod(cellules, m)
+        # Filtre grossier vectorisé, puis vérification exacte au fil des allocations du bloc
+        garder = ligne_vivante[lignes] & colonne_vivante[colonnes]
+        for i, j in zip(lignes[garder].tolist(), colonnes[garder].tolist()):
+            if offres_restantes[i] <= 0 or demandes_restantes[j] <= 0:
+                continue
+            quantite = min(offres_restantes[i], demandes_restantes[j])
+            solution[i][j] = quantite
+            cout_total += quantite * couts[i][j]
+            offres_restantes[i] -= quantite
+            demandes_restantes[j] -= quantite
+            reste -= quantite
+            if offres_restantes[i] <= 0:
+                ligne_vivante[i] = False
+            if demandes_restantes[j] <= 0:
+                colonne_vivante[j] = False
 
     return solution.tolist(), cout_total
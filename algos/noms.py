@@ -0,0 +1,81 @@
+# algos/noms.py
+# Codec bijectif indice <-> nom de nœud "façon tableur" : 0 -> A, 25 -> Z, 26 -> AA, 27 -> AB, ...
+# (même ordre que l'ancienne génération par itertools.product, sans construire la liste).
+import numpy as np
+
+ALPHABET = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+BASE = len(ALPHABET)
+
+
+def index_vers_nom(i):
+    """Nom du nœud d'indice i (i >= 0), en O(longueur du nom)."""
+    if i < 0:
+        raise ValueError(f"Indice de nœud négatif : {i}")
+    lettres = []
+    i += 1 # Numérotation bijective en base 26 (pas de zéro)
+    while i > 0:
+        i, reste = divmod(i - 1, BASE)
+        lettres.append(ALPHABET[reste])
+    return "".join(reversed(lettres))
+
+
+def nom_vers_index(nom):
+    """Indice du nœud `nom` (lettres majuscules A-Z), en O(longueur du nom)."""
+    if not nom or not isinstance(nom, str):
+        raise ValueError(f"Nom de nœud invalide : {nom!r}")
+    i = 0
+    for lettre in nom:
+        if not ("A" <= lettre <= "Z"):
+            raise ValueError(f"Nom de nœud invalide : {nom!r}")
+        i = i * BASE + (ord(lettre) - 64)
+    return i - 1
+
+
+def est_nom_valide(nom, n):
+    """True si `nom` désigne un des n nœuds A, B, ... (test en temps constant par nœud)."""
+    try:
+        return 0 <= nom_vers_index(nom) < n
+    except ValueError:
+        return False
+
+
+def noms_depuis_indices(indices):
+    """
+    Encodage vectorisé d'un tableau d'indices en noms.
+
+    Args:
+        indices (array-like): Indices de nœuds (entiers >= 0).
+
+    Returns:
+        list: Noms correspondants (str).
+    """
+    x = np.asarray(indices, dtype=np.int64)
+    if x.size == 0:
+        return []
+    # Longueur de chaque nom : les noms de longueur L occupent [debut_L, debut_L + 26^L)
+    longueurs = np.ones(x.shape, dtype=np.int64)
+    debut = np.zeros(x.shape, dtype=np.int64)
+    taille_bloc = BASE
+    while True:
+        plus_long = x >= debut + taille_bloc
+        if not plus_long.any():
+            break
+        debut = np.where(plus_long, debut + taille_bloc, debut)
+        longueurs += plus_long
+        taille_bloc *= BASE
+    rang = x - debut
+    l_max = int(longueurs.max())
+
+    # Matrice d'octets alignée à gauche ; les zéros de fin sont retirés par le dtype 'S'
+    octets = np.zeros((x.size, l_max), dtype=np.uint8)
+    for p in range(l_max):
+        exposant = longueurs - 1 - p
+        valide = exposant >= 0
+        chiffre = (rang // BASE ** np.maximum(exposant, 0)) % BASE
+        octets[:, p] = np.where(valide, 65 + chiffre, 0)
+    return octets.view(f"S{l_max}").ravel().astype("U").tolist()
+
+
+def generer_noms_alphabétiques(n):
+    """Génère la liste des n premiers noms de nœuds (A, B, ..., Z, AA, AB, ...)."""
+    return noms_depuis_indices(np.arange(max(n, 0)))
@@ -0,0 +1,153 @@
+# algos/pert.py
+# PERT probabiliste par Monte-Carlo : durées tirées selon une loi bêta-PERT (optimiste, probable, pessimiste),
+# dates propagées sur l'ordre topologique du moteur CPM, une colonne par scénario.
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from algos.cpm import ReseauCPM
+
+ELEMENTS_PAR_LOT = 4_000_000 # Taille max (tâches x scénarios) d'une matrice de lot, ~32 Mo en float64
+PERCENTILES = (50, 80, 90, 95, 99)
+
+
+def _estimations(taches_input):
+    """(optimiste, probable, pessimiste) par nœud ; une durée simple donne une tâche certaine."""
+    trois = [tuple(data['duree']) if np.ndim(data['duree']) else (data['duree'],) * 3 for data in taches_input.values()]
+    o, m, p = np.array([(0, 0, 0), *trois, (0, 0, 0)], dtype=np.float64).T
+    if np.any((o > m) | (m > p)):
+        raise ValueError("Chaque durée PERT doit vérifier optimiste <= probable <= pessimiste.")
+    return o, m, p
+
+
+def _structure(reseau):
+    """
+    Nœuds renumérotés par niveau topologique (chaque niveau devient une tranche de lignes contiguë),
+    arcs groupés par niveau de la cible (passe avant) et par niveau de la source (passe arrière).
+    Un nœud sans prédécesseur (Début, ou une tâche dont aucun prédécesseur saisi n'existe) démarre à 0 ;
+    un nœud sans successeur (Fin, ou Début si toutes les tâches ont des prédécesseurs inconnus) finit
+    au plus tard à la fin du projet. Pour chaque niveau, `lignes` donne les nœuds (relatifs au début
+    de la tranche) couverts par les groupes du reduceat, ou None s'ils la couvrent toute.
+
+    Returns:
+        tuple: (ordre, bornes, src_avant, debuts_avant, dst_arriere, debuts_arriere)
+    """
+    ordre, niveau = reseau.ordre_topologique()
+    nb_niveaux = int(niveau.max(initial=0)) + 1
+    position = np.empty_like(ordre)
+    position[ordre] = np.arange(len(ordre))
+    source, cible = position[reseau.source], position[reseau.cible]
+    bornes = np.searchsorted(niveau[ordre], np.arange(nb_niveaux + 1))
+
+    def grouper(groupe, autre):
+        tri = np.lexsort((autre, groupe)) # Par nœud groupe (donc par niveau), puis par l'autre extrémité
+        groupe = groupe[tri]
+        coupures = np.searchsorted(groupe, bornes) # Arcs de chaque niveau
+        debuts = []
+        for l in range(nb_niveaux):
+            g = groupe[coupures[l]:coupures[l + 1]]
+            d = np.flatnonzero(np.r_[True, g[1:] != g[:-1]]) if len(g) else g
+            lignes = None if len(d) == bornes[l + 1] - bornes[l] else g[d] - bornes[l]
+            debuts.append((coupures[l], coupures[l + 1], d, lignes))
+        return autre[tri], debuts
+
+    src_avant, debuts_avant = grouper(cible, source)
+    dst_arriere, debuts_arriere = grouper(source, cible)
+    return ordre, bornes, src_avant, debuts_avant, dst_arriere, debuts_arriere
+
+
+def _simuler_lot(structure, o, m, p, nb, graine):
+    """
+    Un lot de `nb` scénarios (o, m, p déjà dans l'ordre des niveaux).
+    Renvoie (fins du projet, nombre de scénarios où chaque nœud est critique).
+    """
+    _, bornes, src_avant, debuts_avant, dst_arriere, debuts_arriere = structure
+    rng = np.random.default_rng(graine)
+    n = len(o)
+    largeur = p - o
+    certaine = largeur == 0
+    largeur_sure = np.where(certaine, 1.0, largeur)
+    alpha = np.where(certaine, 1.0, 1 + 4 * (m - o) / largeur_sure)
+    beta = np.where(certaine, 1.0, 1 + 4 * (p - m) / largeur_sure)
+    D = rng.beta(alpha[:, None], beta[:, None], size=(n, nb))
+    D *= largeur[:, None]
+    D += o[:, None]
+
+    # Passe avant : fin au plus tôt, une tranche de lignes par niveau (0 sans prédécesseur)
+    tft = np.empty((n, nb))
+    for l in range(len(bornes) - 1):
+        a, b, debuts, lignes = debuts_avant[l]
+        x, y = bornes[l], bornes[l + 1]
+        if lignes is None:
+            np.maximum.reduceat(tft[src_avant[a:b]], debuts, axis=0, out=tft[x:y])
+        else:
+            tft[x:y] = 0
+            if len(lignes):
+                tft[x + lignes] = np.maximum.reduceat(tft[src_avant[a:b]], debuts, axis=0)
+        tft[x:y] += D[x:y]
+    fin = tft[n - 1].copy()
+
+    # Passe arrière : début au plus tard (fin du projet sans successeur)
+    tard = np.empty((n, nb))
+    for l in range(len(bornes) - 2, -1, -1):
+        a, b, debuts, lignes = debuts_arriere[l]
+        x, y = bornes[l], bornes[l + 1]
+        if lignes is None:
+            np.minimum.reduceat(tard[dst_arriere[a:b]], debuts, axis=0, out=tard[x:y])
+        else:
+            tard[x:y] = fin
+            if len(lignes):
+                tard[x + lignes] = np.minimum.reduceat(tard[dst_arriere[a:b]], debuts, axis=0)
+        tard[x:y] -= D[x:y]
+    # Critique dans un scénario : marge (tard - tôt) nulle à l'arrondi flottant près
+    tard -= tft
+    tard += D
+    critiques = np.count_nonzero(tard <= 1e-9 * np.maximum(fin, 1.0), axis=1)
+    return fin, critiques
+
+
+def simulation_pert(taches_input, nb_scenarios=100000, graine=None, processus=None, percentiles=PERCENTILES):
+    """
+    PERT Monte-Carlo : distribution de la date de fin du projet et indice de criticité de chaque tâche.
+
+    Args:
+        taches_input (dict): {nom: {'duree': (optimiste, probable, pessimiste) ou durée fixe, 'pred': [...]}}.
+        nb_scenarios (int): Nombre de scénarios tirés.
+        graine: Graine NumPy (résultats identiques quel que soit `processus`).
+        processus (int | None): Nombre de processus pour répartir les lots (None = calcul dans ce processus).
+        percentiles (tuple): Percentiles de la date de fin à renvoyer.
+
+    Returns:
+        tuple: (fins, quantiles, criticite)
+            fins (np.ndarray): Date de fin du projet de chaque scénario.
+            quantiles (dict): {percentile: date}, plus 'moyenne' et 'ecart_type'.
+            criticite (dict): {nom: part des scénarios où la tâche est sur un chemin critique}.
+
+    Raises:
+        nx.NetworkXUnfeasible: Si les dépendances contiennent un cycle.
+    """
+    if nb_scenarios < 1:
+        raise ValueError("Le nombre de scénarios doit être au moins 1.")
+    o, m, p = _estimations(taches_input)
+    reseau = ReseauCPM(taches_input, durees=m)
+    structure = _structure(reseau)
+    ordre = structure[0]
+    o, m, p = o[ordre], m[ordre], p[ordre]
+    n = reseau.nb_taches
+
+    taille_lot = max(1, ELEMENTS_PAR_LOT // n)
+    tailles = [min(taille_lot, nb_scenarios - k) for k in range(0, nb_scenarios, taille_lot)]
+    graines = np.random.SeedSequence(graine).spawn(len(tailles))
+    arguments = [(structure, o, m, p, nb, g) for nb, g in zip(tailles, graines)]
+    if processus and processus > 1 and len(tailles) > 1:
+        with ProcessPoolExecutor(max_workers=processus) as pool:
+            resultats = list(pool.map(_simuler_lot, *zip(*arguments)))
+    else:
+        resultats = [_simuler_lot(*args) for args in arguments]
+
+    fins = np.concatenate([fin for fin, _ in resultats])
+    critiques = np.empty(n, dtype=np.int64)
+    critiques[ordre] = np.sum([c for _, c in resultats], axis=0)
+    quantiles = dict(zip(percentiles, np.percentile(fins, percentiles).tolist()))
+    quantiles['moyenne'] = float(fins.mean())
+    quantiles['ecart_type'] = float(fins.std())
+    criticite = {reseau.noms[i]: float(critiques[i] / nb_scenarios) for i in range(1, n - 1)}
+    return fins, quantiles, criticite
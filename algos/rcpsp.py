@@ -0,0 +1,154 @@
+# algos/rcpsp.py
+# Ordonnancement sous contraintes de ressources (RCPSP) : schéma sériel de génération (SGS)
+# guidé par les dates du moteur CPM, avec relances aléatoires éventuellement réparties sur plusieurs processus.
+from concurrent.futures import ProcessPoolExecutor
+import heapq
+import numpy as np
+from algos.cpm import ReseauCPM
+
+REGLES = ('lst', 'marge') # Début au plus tard (CPM) ou marge totale, la plus petite d'abord
+
+
+def _donnees(taches_input, capacites):
+    """Réseau CPM, matrice des demandes (nœuds x ressources) et capacités."""
+    reseau = ReseauCPM(taches_input)
+    noms_ressources = list(capacites)
+    rang_ressource = {r: k for k, r in enumerate(noms_ressources)}
+    demandes = np.zeros((reseau.nb_taches, len(noms_ressources)), dtype=np.int64)
+    for i, (nom, data) in enumerate(taches_input.items(), start=1):
+        for r, q in data.get('ressources', {}).items():
+            if r not in rang_ressource:
+                raise ValueError(f"Ressource inconnue '{r}' demandée par la tâche '{nom}'.")
+            if q > capacites[r]:
+                raise ValueError(f"La tâche '{nom}' demande {q} '{r}' pour une capacité de {capacites[r]}.")
+            demandes[i, rang_ressource[r]] = q
+    capacite = np.array([capacites[r] for r in noms_ressources], dtype=np.int64)
+    return reseau, demandes, capacite
+
+
+def _premier_creneau(profil, res, dem, cap, t, d):
+    """
+    Premier instant >= t où d unités de temps consécutives laissent passer la demande `dem`
+    sur les ressources `res`. Une fenêtre (de largeur doublée à chaque échec) est testée d'un coup :
+    les instants saturés sont localisés, puis le premier écart d'au moins d entre deux d'entre eux.
+    """
+    largeur = 4 * d + 64
+    while True:
+        satures = np.flatnonzero((profil[res, t:t + largeur] + dem > cap).any(axis=0))
+        if not len(satures) or satures[0] >= d:
+            return t
+        trous = np.flatnonzero(np.diff(satures) > d)
+        if len(trous):
+            return t + int(satures[trous[0]]) + 1
+        t += int(satures[-1]) + 1
+        largeur *= 2
+
+
+def _sgs_seriel(durees, pred_offsets, pred_sources, succ_offsets, succ_cibles, demandes, capacite, cles):
+    """
+    Un passage du SGS sériel : la tâche éligible (tous ses prédécesseurs placés) de plus petite clé
+    est placée au plus tôt compatible avec les précédences et le profil des ressources.
+
+    Le profil est un tableau (ressources x temps) ; l'horizon sum(durées) suffit toujours
+    (une tâche peut au pire commencer après toutes celles déjà placées).
+
+    Returns:
+        np.ndarray: Date de début de chaque nœud.
+    """
+    n = len(durees)
+    horizon = int(sum(durees)) + 1
+    profil = np.zeros((len(capacite), horizon), dtype=np.int64)
+    restants = [pred_offsets[i + 1] - pred_offsets[i] for i in range(n)]
+    fin_au_plus_tot = [0] * n # Max des fins des prédécesseurs déjà placés
+    debuts = [0] * n
+    utilise = [np.flatnonzero(demandes[i]) for i in range(n)]
+    tas = [(cles[i], i) for i in range(n) if restants[i] == 0]
+    heapq.heapify(tas)
+    while tas:
+        _, i = heapq.heappop(tas)
+        d = durees[i]
+        t = fin_au_plus_tot[i]
+        res = utilise[i]
+        if d and len(res):
+            dem = demandes[i, res][:, None]
+            t = _premier_creneau(profil, res, dem, capacite[res][:, None], t, d)
+            profil[res, t:t + d] += dem
+        debuts[i] = t
+        for k in range(succ_offsets[i], succ_offsets[i + 1]):
+            s = succ_cibles[k]
+            if t + d > fin_au_plus_tot[s]:
+                fin_au_plus_tot[s] = t + d
+            restants[s] -= 1
+            if restants[s] == 0:
+                heapq.heappush(tas, (cles[s], s))
+    return np.asarray(debuts, dtype=np.int64)
+
+
+def _passes(donnees, valeurs, bruit, graines):
+    """
+    Un passage du SGS par graine, clés = valeurs de la règle + bruit uniforme (graine None :
+    règle seule). Renvoie le meilleur (fin, débuts), le premier en cas d'égalité.
+    """
+    durees = donnees[0]
+    meilleur = None
+    for graine in graines:
+        cles = valeurs if graine is None else valeurs + bruit * np.random.default_rng(graine).random(len(valeurs))
+        debuts = _sgs_seriel(*donnees, cles.tolist())
+        fin = int(debuts[-1] + durees[-1])
+        if meilleur is None or fin < meilleur[0]:
+            meilleur = (fin, debuts)
+    return meilleur
+
+
+def ordonnancement_ressources(taches_input, capacites, regle='lst', nb_passes=1, graine=None, processus=None, bruit=0.5):
+    """
+    Ordonnancement sous contraintes de ressources par SGS sériel.
+
+    Args:
+        taches_input (dict): {nom: {'duree': int, 'pred': [...], 'ressources': {ressource: quantité}}}.
+        capacites (dict): {ressource: capacité disponible à chaque instant}.
+        regle (str): Règle de priorité : 'lst' (début au plus tard CPM) ou 'marge' (marge totale CPM).
+        nb_passes (int): Nombre de passages ; le premier suit la règle seule, les suivants perturbent
+            les clés d'un bruit uniforme de `bruit` fois la durée moyenne des tâches.
+        graine: Graine NumPy des passages aléatoires (même résultat quel que soit `processus`).
+        processus (int | None): Nombre de processus pour répartir les passages (None = ce processus).
+
+    Returns:
+        tuple: (debuts, fin_projet, borne_cpm)
+            debuts (dict): {nom: date de début} des tâches utilisateur.
+            fin_projet (int): Durée totale de l'ordonnancement retenu.
+            borne_cpm (int): Durée du chemin critique sans ressources (borne inférieure).
+
+    Raises:
+        nx.NetworkXUnfeasible: Si les dépendances contiennent un cycle.
+    """
+    if regle not in REGLES:
+        raise ValueError(f"Règle de priorité inconnue : '{regle}' (attendu 'lst' ou 'marge').")
+    if nb_passes < 1:
+        raise ValueError("Le nombre de passages doit être au moins 1.")
+    reseau, demandes, capacite = _donnees(taches_input, capacites)
+    dates = reseau.calculer_dates()
+    valeurs = (dates['tard'] if regle == 'lst' else dates['marge']).astype(np.float64)
+    donnees = (
+        reseau.durees.tolist(),
+        reseau.pred_offsets.tolist(), reseau.pred_sources.tolist(),
+        reseau.succ_offsets.tolist(), reseau.succ_cibles.tolist(),
+        demandes, capacite,
+    )
+    n = reseau.nb_taches
+    amplitude = bruit * max(1.0, float(reseau.durees[1:n - 1].mean()) if n > 2 else 1.0)
+
+    # Une graine par passage, puis répartition en lots contigus : le résultat ne dépend pas de `processus`
+    graines = [None, *np.random.SeedSequence(graine).spawn(nb_passes - 1)]
+    nb_lots = min(nb_passes, processus or 1)
+    bornes = np.linspace(0, nb_passes, nb_lots + 1).astype(int)
+    lots = [graines[bornes[k]:bornes[k + 1]] for k in range(nb_lots)]
+    if nb_lots > 1:
+        with ProcessPoolExecutor(max_workers=nb_lots) as pool:
+            resultats = list(pool.map(_passes, [donnees] * nb_lots, [valeurs] * nb_lots, [amplitude] * nb_lots, lots))
+    else:
+        resultats = [_passes(donnees, valeurs, amplitude, lots[0])]
+
+    fin_projet, debuts = min(resultats, key=lambda r: r[0])
+    debuts = {reseau.noms[i]: int(debuts[i]) for i in range(1, n - 1)}
+    return debuts, fin_projet, int(dates['tft'][n - 1])
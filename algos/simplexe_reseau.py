@@ -0,0 +1,327 @@
+# algos/simplexe_reseau.py
+# Simplexe réseau pour le problème de transport : arbre de base en tableaux (parent, fil de parcours
+# en profondeur, tailles de sous-arbres), tarification par liste de candidats et arithmétique entière.
+import numpy as np
+from algos.stepping_stone import solution_initiale
+
+NB_CANDIDATS = 256 # Taille visée de la liste de candidats à chaque remplissage
+PAR_BLOC = 16 # Candidats retenus au plus par bloc tarifé (les plus négatifs)
+MINEURES_MAX = 128 # Pivots sur une même liste avant de la reconstruire
+
+
+class _ArbreFil:
+    """
+    Arbre de base sur les nœuds lignes (0..n-1) et colonnes (n..n+m-1), en listes indexées par nœud :
+      parent, cellule (indice i*m+j de la cellule vers le parent), flux (quantité sur cette cellule),
+      taille (du sous-arbre), suivant / precedent (fil circulaire du parcours en profondeur),
+      dernier (dernier descendant dans le fil).
+    Un sous-arbre est la tranche du fil entre un nœud et son dernier descendant : décrocher,
+    réenraciner et raccrocher un sous-arbre ne touche que les nœuds concernés.
+    """
+
+    def __init__(self, n, m, base, quantites, couts):
+        N = n + m
+        self.n, self.m = n, m
+        voisins = [[] for _ in range(N)]
+        for k in base:
+            i, j = divmod(k, m)
+            voisins[i].append((n + j, k))
+            voisins[n + j].append((i, k))
+        self.parent = [-1] * N
+        self.cellule = [-1] * N
+        self.flux = [0] * N
+        self.taille = [1] * N
+        self.potentiel = pot = [0] * N # u_i (lignes) puis v_j (colonnes), u_i + v_j = c_ij sur la base
+        couts_plats = couts.ravel().tolist()
+
+        ordre = [] # Parcours en profondeur depuis la racine 0 (ordre préfixe : sous-arbres contigus)
+        pile = [0]
+        vu = [False] * N
+        vu[0] = True
+        while pile:
+            x = pile.pop()
+            ordre.append(x)
+            for y, k in voisins[x]:
+                if not vu[y]:
+                    vu[y] = True
+                    self.parent[y], self.cellule[y], self.flux[y] = x, k, quantites[k]
+                    pot[y] = couts_plats[k] - pot[x]
+                    pile.append(y)
+        for x in reversed(ordre[1:]):
+            self.taille[self.parent[x]] += self.taille[x]
+        rang = [0] * N
+        for r, x in enumerate(ordre):
+            rang[x] = r
+        self.suivant = [ordre[(rang[x] + 1) % N] for x in range(N)]
+        self.precedent = [ordre[rang[x] - 1] for x in range(N)]
+        self.dernier = [ordre[rang[x] + self.taille[x] - 1] for x in range(N)]
+
+    def decaler(self, x, fin, d_lignes, d_colonnes):
+        """Ajoute d_lignes (d_colonnes) au potentiel des nœuds lignes (colonnes) du fil de x à fin inclus."""
+        pot, suivant, n = self.potentiel, self.suivant, self.n
+        while True:
+            pot[x] += d_lignes if x < n else d_colonnes
+            if x == fin:
+                return
+            x = suivant[x]
+
+    def sommet(self, p, q):
+        """Ancêtre commun le plus proche, trouvé en remontant le nœud de plus petit sous-arbre."""
+        taille, parent = self.taille, self.parent
+        tp, tq = taille[p], taille[q]
+        while True:
+            while tp < tq:
+                p = parent[p]; tp = taille[p]
+            while tp > tq:
+                q = parent[q]; tq = taille[q]
+            if tp == tq:
+                if p == q:
+                    return p
+                p = parent[p]; tp = taille[p]
+                q = parent[q]; tq = taille[q]
+
+    def chemin(self, x, sommet):
+        """Nœuds de x (inclus) jusqu'au sommet (exclu) : chacun représente la cellule vers son parent."""
+        noeuds = []
+        while x != sommet:
+            noeuds.append(x)
+            x = self.parent[x]
+        return noeuds
+
+    def decrocher(self, t):
+        """Retire l'arête (t, parent[t]) : le sous-arbre de t devient un fil circulaire à part."""
+        s = self.parent[t]
+        taille_t = self.taille[t]
+        prec_t, dernier_t = self.precedent[t], self.dernier[t]
+        apres = self.suivant[dernier_t]
+        self.parent[t] = -1
+        self.suivant[prec_t], self.precedent[apres] = apres, prec_t
+        self.suivant[dernier_t], self.precedent[t] = t, dernier_t
+        while s != -1:
+            self.taille[s] -= taille_t
+            if self.dernier[s] == dernier_t:
+                self.dernier[s] = prec_t
+            s = self.parent[s]
+
+    def reenraciner(self, q):
+        """Fait de q la racine de son (sous-)arbre décroché, en inversant le chemin q -> racine."""
+        ancetres = []
+        while q != -1:
+            ancetres.append(q)
+            q = self.parent[q]
+        ancetres.reverse()
+        for p, q in zip(ancetres, ancetres[1:]):
+            taille_p, dernier_p = self.taille[p], self.dernier[p]
+            prec_q, dernier_q = self.precedent[q], self.dernier[q]
+            apres_q = self.suivant[dernier_q]
+            # p devient enfant de q (la cellule et son flux changent de porteur)
+            self.parent[p], self.parent[q] = q, -1
+            self.cellule[p], self.cellule[q] = self.cellule[q], -1
+            self.flux[p], self.flux[q] = self.flux[q], 0
+            self.taille[p] = taille_p - self.taille[q]
+            self.taille[q] = taille_p
+            # Sortir le sous-arbre de q du fil de p, puis y remettre le reste de p à la suite de q
+            self.suivant[prec_q], self.precedent[apres_q] = apres_q, prec_q
+            self.suivant[dernier_q], self.precedent[q] = q, dernier_q
+            if dernier_p == dernier_q:
+                self.dernier[p] = prec_q
+                dernier_p = prec_q
+            self.precedent[p], self.suivant[dernier_q] = dernier_q, p
+            self.suivant[dernier_p], self.precedent[q] = q, dernier_p
+            self.dernier[q] = dernier_p
+
+    def accrocher(self, k, p, q, flux):
+        """Raccroche le sous-arbre de racine q sous p par la cellule k."""
+        dernier_p = self.dernier[p]
+        apres_p = self.suivant[dernier_p]
+        taille_q, dernier_q = self.taille[q], self.dernier[q]
+        self.parent[q], self.cellule[q], self.flux[q] = p, k, flux
+        self.suivant[dernier_p], self.precedent[q] = q, dernier_p
+        self.precedent[apres_p], self.suivant[dernier_q] = dernier_q, apres_p
+        while p != -1:
+            self.taille[p] += taille_q
+            if self.dernier[p] == dernier_p:
+                self.dernier[p] = dernier_q
+            p = self.parent[p]
+
+
+def _base_complete(n, m, quantites, couts):
+    """
+    Cellules occupées, complétées (solution dégénérée) par les cellules nulles les moins chères
+    qui relient deux morceaux : exactement n + m - 1 cellules, sans cycle.
+    """
+    uf = list(range(n + m))
+
+    def unir(k):
+        a, b = k // m, n + k % m
+        while uf[a] != a:
+            uf[a] = uf[uf[a]]
+            a = uf[a]
+        while uf[b] != b:
+            uf[b] = uf[uf[b]]
+            b = uf[b]
+        if a == b:
+            return False
+        uf[a] = b
+        return True
+
+    base = [k for k in np.flatnonzero(quantites > 0).tolist() if unir(k)]
+    if len(base) < n + m - 1:
+        for k in np.argsort(couts, axis=None, kind='stable').tolist():
+            if unir(k):
+                base.append(k)
+                if len(base) == n + m - 1:
+                    break
+    return base
+
+
+def simplexe_reseau(offres, demandes, couts, methode_initiale='auto', taille_bloc=None):
+    """
+    Résout le problème de transport par le simplexe réseau.
+
+    Tarification par liste de candidats : quand la liste est épuisée (ou après MINEURES_MAX pivots),
+    des blocs de lignes entières (environ taille_bloc cellules, par défaut n*m/64) sont tarifés à partir
+    de là où le remplissage précédent s'est arrêté, et chacun y verse ses PAR_BLOC cellules les plus
+    négatives, jusqu'à NB_CANDIDATS ; entre deux remplissages, seuls les coûts réduits des candidats sont
+    recalculés et le plus négatif entre. L'optimum est atteint quand un tour complet n'en trouve aucun.
+    Après un pivot dégénéré, la règle de Bland (première cellule améliorante, première cellule sortante
+    par indice) est appliquée jusqu'au prochain pivot non dégénéré, ce qui exclut le cyclage.
+    Les potentiels du sous-arbre raccroché sont décalés en parcourant le fil sur place.
+    Coûts et quantités restent entiers (si les coûts sont entiers) : aucun arrondi.
+
+    Args:
+        offres (list): Liste des offres pour chaque source.
+        demandes (list): Liste des demandes pour chaque destination.
+        couts (list): Matrice des coûts (sources x destinations).
+        methode_initiale (str): Solution de base initiale ('auto', 'nord_ouest', 'moindre_cout', 'vogel').
+        taille_bloc (int | None): Nombre approximatif de cellules tarifées par bloc (arrondi à des lignes entières).
+
+    Returns:
+        tuple: Comme `stepping_stone` : (solution, cout_total, iterations, methode, solution_initiale,
+            cout_initial, solution).
+    """
+    if sum(offres) != sum(demandes):
+        raise ValueError("La somme des offres doit égaler la somme des demandes.")
+
+    solution_init_list, cout_init, methode = solution_initiale(offres, demandes, couts, methode_initiale)
+    n, m = len(offres), len(demandes)
+    C = np.asarray(couts).reshape(n, m)
+    if np.issubdtype(C.dtype, np.floating) and np.all(C == np.round(C)):
+        C = C.astype(np.int64)
+    seuil = 0 if np.issubdtype(C.dtype, np.integer) else 1e-9
+    nb_cellules = n * m
+    quantites = np.array(solution_init_list, dtype=np.int64).reshape(nb_cellules)
+
+    iterations = 0
+    if nb_cellules:
+        arbre = _ArbreFil(n, m, _base_complete(n, m, quantites, C), quantites.tolist(), C)
+        C_plat = C.ravel()
+        # Blocs de lignes entières : coûts réduits d'une tranche C[a:b] - u[a:b, None] - v[None, :]
+        bloc = max(1, -(-(taille_bloc or max(1024, nb_cellules // 64)) // m))
+        pot = arbre.potentiel
+        candidats = [] # (cellule, coût, nœud ligne, nœud colonne) de coût réduit négatif au dernier examen
+        mineures = 0 # Pivots depuis le dernier remplissage de la liste
+        debut = 0 # Première ligne du prochain bloc tarifé
+        bland = False
+        while True:
+            iterations += 1
+            entrante = -1
+
+            if bland:
+                # --- Règle de Bland : première cellule améliorante, depuis la ligne 0 par blocs doublés ---
+                P = np.array(pot, dtype=C.dtype)
+                u, v = P[:n], P[n:]
+                a, largeur = 0, max(1, 1024 // m)
+                while a < n and entrante == -1:
+                    b = min(a + largeur, n)
+                    delta = (C[a:b] - u[a:b, None] - v[None, :]).ravel()
+                    r = int(np.argmax(delta < -seuil))
+                    if delta[r] < -seuil:
+                        entrante = a * m + r
+                    a, largeur = b, 2 * largeur
+            else:
+                # --- Liste de candidats : seuls ses coûts réduits sont recalculés à chaque pivot ---
+                if mineures >= MINEURES_MAX:
+                    candidats, mineures = [], 0
+                meilleur = -seuil
+                gardes = []
+                for candidat in candidats:
+                    k, c, i, j = candidat
+                    r = c - pot[i] - pot[j]
+                    if r < -seuil:
+                        gardes.append(candidat)
+                        if r < meilleur:
+                            meilleur, entrante = r, k
+                candidats = gardes
+                if entrante == -1:
+                    # Liste épuisée : blocs successifs (tour complet au plus), les plus négatives de chacun
+                    P = np.array(pot, dtype=C.dtype)
+                    u, v = P[:n], P[n:]
+                    examinees = 0
+                    while examinees < n and len(candidats) < NB_CANDIDATS:
+                        a = debut
+                        b = min(a + bloc, n)
+                        delta = (C[a:b] - u[a:b, None] - v[None, :]).ravel()
+                        examinees += b - a
+                        debut = b % n
+                        negatifs = np.flatnonzero(delta < -seuil)
+                        if len(negatifs) > PAR_BLOC:
+                            negatifs = negatifs[np.argpartition(delta[negatifs], PAR_BLOC)[:PAR_BLOC]]
+                        for r in negatifs.tolist():
+                            k = a * m + r
+                            candidats.append((k, C_plat[k].item(), k // m, n + k % m))
+                            if delta[r] < meilleur:
+                                meilleur, entrante = delta[r], k
+                    mineures = 0
+            if entrante == -1:
+                break # Solution optimale trouvée
+            mineures += 1
+
+            # --- Cycle : chemins des deux extrémités jusqu'à leur ancêtre commun ---
+            i, j = divmod(entrante, m)
+            p, q = i, n + j
+            sommet = arbre.sommet(p, q)
+            cote_p, cote_q = arbre.chemin(p, sommet), arbre.chemin(q, sommet)
+            # À partir de chaque extrémité, les cellules de rang pair perdent la quantité, les autres la reçoivent
+            moins = cote_p[0::2] + cote_q[0::2]
+            plus = cote_p[1::2] + cote_q[1::2]
+            flux, cellule = arbre.flux, arbre.cellule
+            theta = min(flux[x] for x in moins)
+            sortant = min((cellule[x], x) for x in moins if flux[x] == theta)[1]
+            for x in moins:
+                flux[x] -= theta
+            for x in plus:
+                flux[x] += theta
+            bland = theta == 0
+
+            # --- Mise à jour de l'arbre : le sous-arbre décroché est raccroché par la cellule entrante ---
+            if sortant in cote_p:
+                p, q = q, p # q = extrémité de la cellule entrante située sous la cellule sortante
+            arbre.decrocher(sortant)
+            arbre.reenraciner(q)
+            arbre.accrocher(entrante, p, q, theta)
+            # Potentiels du sous-arbre, en parcourant le fil sur place : +d du côté (lignes/colonnes) de q, -d de l'autre ;
+            # si le sous-arbre dépasse la moitié, décalage opposé sur le reste (mêmes coûts réduits)
+            d = C_plat[entrante].item() - pot[p] - pot[q]
+            d_lignes, d_colonnes = (d, -d) if q < n else (-d, d)
+            if 2 * arbre.taille[q] > n + m:
+                arbre.decaler(arbre.suivant[arbre.dernier[q]], arbre.precedent[q], -d_lignes, -d_colonnes)
+            else:
+                arbre.decaler(q, arbre.dernier[q], d_lignes, d_colonnes)
+
+        quantites[:] = 0
+        for x in range(n + m):
+            if arbre.cellule[x] != -1:
+                quantites[arbre.cellule[x]] = arbre.flux[x]
+
+    solution = quantites.reshape(n, m)
+    solution_finale_list = solution.tolist()
+    return (
+        solution_finale_list,
+        float(np.sum(solution * C)),
+        iterations,
+        methode, # Initial method
+        solution_init_list, # Initial solution (list of lists)
+        float(cout_init), # Initial cost
+        solution_finale_list # Last solution state
+    )
@@ -3,262 +3,220 @@ import numpy as np
 # Assuming NordO.py and moindre_cout.py are in the same 'algos' directory
 from algos.NordO import nord_ouest
 from algos.moindre_cout import moindre_cout
-import random # Added for potential use, though not directly in this snippet
+from algos.vogel import vogel
 
-# (Your stepping_stone and trouver_chemin functions as provided)
-def trouver_chemin(solution, i_dep, j_dep):
+class ArbreBase:
     """
-    Cherche un chemin fermé pour l'amélioration dans Stepping-Stone.
-    Un chemin est une séquence de cellules (i,j) où l'on alterne ajout et retrait de qte.
-    Il doit commencer et se terminer à (i_dep, j_dep) et avoir au moins 4 cellules.
-    Les virages se font sur des cellules de base (solution[x][y] > 0).
+    Base du problème de transport vue comme un arbre couvrant : les nœuds sont les lignes
+    (0..n-1) et les colonnes (n..n+m-1), chaque cellule de base (i, j) est l'arête i - (n+j).
+
+    La base compte toujours exactement n + m - 1 cellules : les cellules occupées, complétées
+    si la solution est dégénérée par les cellules (de quantité nulle) les moins chères qui relient
+    les morceaux de forêt, comme dans Kruskal.
+
+    Chaque nœud garde son parent, la cellule qui l'y relie, sa profondeur
+    et son potentiel (u_i pour une ligne, v_j pour une colonne, avec u_i + v_j = c_ij sur la base).
+    Le voisinage est gardé en dictionnaires d'adjacence ; après un pivot, seul le sous-arbre
+    décroché est reparcouru (parents, profondeurs et potentiels), soit O(n + m) au pire.
+    Seule la mise à jour de l'arbre est linéaire : `stepping_stone` tarifie encore toutes les cellules
+    à chaque itération, en O(n*m). Le fil de parcours et la tarification partielle sont dans
+    `algos.simplexe_reseau`.
     """
-    n, m = solution.shape
-    
-    # path_stack: (current_i, current_j, current_path_list, last_move_direction (0:horizontal, 1:vertical))
-    # The initial cell (i_dep, j_dep) is a "receiving" cell (+qte)
-    
-    # We need to find a cycle. Let's try a Depth First Search approach.
-    # The path needs to alternate horizontal and vertical moves.
-    # Cells in the path (except start/end) must be basic variables (solution > 0)
-    # for cells where we subtract qte. The start cell (i_dep, j_dep) is non-basic.
-
-    # A path looks like: (i0,j0)+, (i0,j1)-, (i1,j1)+, (i1,j0)-, ... (ix,j0)+ -> back to (i0,j0)
-    
-    q = [] # queue for BFS like search for a cycle. (current_row, current_col, path_taken, last_direction_horizontal)
-    
-    # Try starting with a horizontal move from (i_dep, j_dep)
-    # Path stores (row, col) tuples
-    q.append((i_dep, j_dep, [(i_dep, j_dep)], True)) # last_move_was_horizontal = True initially (conceptually)
-
-    visited_states = set() # To avoid redundant searches: (current_cell, last_cell_in_path_tuple, frozenset(path_cells))
-
-    while q:
-        r, c, current_path, last_move_horizontal = q.pop(0)
-        
-        state = ((r,c), tuple(current_path[-2:]) if len(current_path)>1 else tuple(current_path[-1:]), frozenset(current_path))
-        if state in visited_states:
-            continue
-        visited_states.add(state)
-
-        # Next move should be in the other direction
-        if last_move_horizontal: # Try vertical moves
-            for nr in range(n):
-                if nr == r: continue # Must move to a different row
-
-                # If this is the closing move back to the start column AND it's a valid path length
-                if c == j_dep and nr == i_dep and len(current_path) >= 3 : # Path of 3 + this = 4
-                    final_path = current_path + [(nr, c)]
-                    # Validate path structure (alternating row/col changes)
-                    # For a path p0,p1,p2,p3 (p3=p0):
-                    # p0=(r0,c0), p1=(r0,c1), p2=(r1,c1), p3=(r1,c0) -> valid
-                    if len(final_path) % 2 == 0: # Even number of segments for a closed loop
-                        is_valid_structure = True
-                        for k in range(len(final_path) -1):
-                            p_curr = final_path[k]
-                            p_next = final_path[(k+1)] #% len(final_path)] for true cycle
-                            if k % 2 == 0: # Horizontal segment expected
-                                if p_curr[0] != p_next[0] or p_curr[1] == p_next[1]:
-                                    is_valid_structure = False; break
-                            else: # Vertical segment expected
-                                if p_curr[1] != p_next[1] or p_curr[0] == p_next[0]:
-                                    is_valid_structure = False; break
-                        if is_valid_structure:
-                            return final_path[:-1] # Return path without repeating start if cycle check is good
-                    # The original implementation seems to rely on BFS finding a cycle of specific form
-                    # This simple BFS needs refinement for robust stepping stone cycle finding.
-                    # The provided BFS is more like a general graph traversal.
-                    # For now, let's assume the structure of the problem guides it.
-                    # The key is that path must be closed, have even length >= 4, and alternate turns.
-                    # And - marked cells must be basic variables.
-
-                # If it's a basic variable (or the very first cell of the path again for closing)
-                # The (nr,c) cell is a candidate for a '+' or '-' cell.
-                # If it's a '-' cell (odd index in path), it must be > 0
-                # If it's a '+' cell (even index), it can be 0 (like i_dep, j_dep)
-                is_minus_cell = (len(current_path)) % 2 == 1 # 0-indexed path, so path[1] is first '-'
-
-                if solution[nr][c] > 0 or ((nr,c) == (i_dep, j_dep) and len(current_path) >=3 ) :
-                     if not is_minus_cell or solution[nr][c] > 0 : # Ensure minus cells are basic
-                        new_path = current_path + [(nr, c)]
-                        # If we returned to (i_dep, j_dep) and path is long enough
-                        if (nr,c) == (i_dep, j_dep) and len(new_path) >= 4 and len(new_path) % 2 == 1: # odd path len before closing, so total is even
-                            # check structure
-                            valid = True
-                            for k_chk in range(len(new_path)-1):
-                                r1,c1 = new_path[k_chk]
-                                r2,c2 = new_path[k_chk+1]
-                                if k_chk % 2 == 0 : # from (i_dep,j_dep) should be horizontal
-                                    if r1 != r2: valid=False; break # Expected horizontal
-                                else:
-                                    if c1 != c2: valid=False; break # Expected vertical
-                            if valid: return new_path[:-1] # Return path without the final duplicate of start_node
-
-                        if (nr,c) not in current_path or ((nr,c) == (i_dep, j_dep) and len(current_path) >=3): # Prevent trivial cycles or allow closing
-                             q.append((nr, c, new_path, False)) # Next move must be horizontal
-
-        else: # Try horizontal moves (last_move_horizontal was False)
-            for nc in range(m):
-                if nc == c: continue
-
-                is_minus_cell = (len(current_path)) % 2 == 1
-
-                if solution[r][nc] > 0 or ((r,nc) == (i_dep, j_dep) and len(current_path) >=3) :
-                    if not is_minus_cell or solution[r][nc] > 0 :
-                        new_path = current_path + [(r, nc)]
-                        if (r,nc) == (i_dep, j_dep) and len(new_path) >= 4 and len(new_path) % 2 == 1:
-                            valid = True
-                            for k_chk in range(len(new_path)-1):
-                                r1,c1 = new_path[k_chk]
-                                r2,c2 = new_path[k_chk+1]
-                                if k_chk % 2 == 0 : # from (i_dep,j_dep) should be vertical if first one here was horizontal
-                                     if c1 != c2: valid=False; break
-                                else:
-                                     if r1 != r2: valid=False; break
-                            if valid: return new_path[:-1]
-
-                        if (r,nc) not in current_path or ((r,nc) == (i_dep, j_dep) and len(current_path) >=3):
-                            q.append((r, nc, new_path, True)) # Next move must be vertical
-    return None # No valid cycle found
 
+    def __init__(self, n, m, cellules, couts):
+        self.n, self.m = n, m
+        self.couts = couts
+        N = n + m
+        self.voisins = [dict() for _ in range(N)] # nœud -> {voisin: cellule (i, j)}
+        self.parent = [-1] * N
+        self.cellule_parent = [None] * N
+        self.profondeur = [0] * N
+        self.potentiel = [0] * N
+        # Les cellules qui fermeraient un cycle sont écartées (union-find)
+        uf = list(range(N))
+        nb_base = 0
+        for i, j in cellules:
+            nb_base += self._unir(uf, (i, j))
+        if nb_base < N - 1:
+            # Base dégénérée : cellules nulles les moins chères reliant deux morceaux (ordre de coût stable)
+            for k in np.argsort(np.asarray(couts), axis=None, kind='stable').tolist():
+                nb_base += self._unir(uf, divmod(k, m))
+                if nb_base == N - 1:
+                    break
+        if N:
+            self._accrocher(0, -1, None, 0, 0)
+
+    def _unir(self, uf, cellule):
+        """Ajoute la cellule à la base si elle relie deux morceaux distincts ; renvoie 1 si ajoutée."""
+        a, b = cellule[0], self.n + cellule[1]
+        while uf[a] != a:
+            uf[a] = uf[uf[a]]
+            a = uf[a]
+        while uf[b] != b:
+            uf[b] = uf[uf[b]]
+            b = uf[b]
+        if a == b:
+            return 0
+        uf[a] = b
+        self._lier(cellule)
+        return 1
+
+    def _lier(self, cellule):
+        i, j = cellule
+        self.voisins[i][self.n + j] = cellule
+        self.voisins[self.n + j][i] = cellule
+
+    def _delier(self, cellule):
+        i, j = cellule
+        del self.voisins[i][self.n + j]
+        del self.voisins[self.n + j][i]
+
+    def _accrocher(self, racine, parent, cellule, profondeur, potentiel):
+        """(Re)calcule parent, profondeur et potentiel du sous-arbre de `racine`."""
+        n, couts = self.n, self.couts
+        self.parent[racine], self.cellule_parent[racine] = parent, cellule
+        self.profondeur[racine], self.potentiel[racine] = profondeur, potentiel
+        pile = [racine]
+        while pile:
+            x = pile.pop()
+            for y, (i, j) in self.voisins[x].items():
+                if y == self.parent[x]:
+                    continue
+                self.parent[y], self.cellule_parent[y] = x, (i, j)
+                self.profondeur[y] = self.profondeur[x] + 1
+                self.potentiel[y] = couts[i][j] - self.potentiel[x]
+                pile.append(y)
+
+    def potentiels(self):
+        """(u, v) en tableaux NumPy."""
+        pot = np.asarray(self.potentiel)
+        return pot[:self.n], pot[self.n:]
+
+    def cycle(self, i, j):
+        """
+        Cycle créé par la cellule hors base (i, j) : remontée des deux extrémités jusqu'à leur ancêtre commun.
+        Renvoie la liste des cellules (la cellule entrante d'abord, signes alternés +, -, +, ...)
+        et, pour chaque cellule de l'arbre, le nœud enfant de l'arête correspondante.
+        """
+        a, b = i, self.n + j
+        cote_a, cote_b = [], []
+        profondeur, parent = self.profondeur, self.parent
+        while profondeur[a] > profondeur[b]:
+            cote_a.append(a); a = parent[a]
+        while profondeur[b] > profondeur[a]:
+            cote_b.append(b); b = parent[b]
+        while a != b:
+            cote_a.append(a); a = parent[a]
+            cote_b.append(b); b = parent[b]
+        enfants = cote_b + cote_a[::-1]
+        return [(i, j)] + [self.cellule_parent[x] for x in enfants], [None] + enfants
+
+    def pivoter(self, entrante, sortante, enfant_sortant):
+        """Remplace la cellule `sortante` (arête vers son nœud `enfant_sortant`) par `entrante`."""
+        self._delier(sortante)
+        self._lier(entrante)
+        # L'extrémité de la cellule entrante située sous enfant_sortant devient la racine du sous-arbre décroché
+        i, j = entrante
+        a, b = i, self.n + j
+        y = a
+        while self.profondeur[y] > self.profondeur[enfant_sortant]:
+            y = self.parent[y]
+        racine, attache = (a, b) if y == enfant_sortant else (b, a)
+        self._accrocher(racine, attache, entrante, self.profondeur[attache] + 1,
+                        self.couts[i][j] - self.potentiel[attache])
+
+
+# Méthodes de solution initiale : clé -> (nom affiché, fonction)
+METHODES_INITIALES = {
+    'nord_ouest': ("Nord-Ouest", nord_ouest),
+    'moindre_cout': ("Moindre Coût", moindre_cout),
+    'vogel': ("Vogel", vogel),
+}
+
+
+def solution_initiale(offres, demandes, couts, methode_initiale='auto'):
+    """
+    Solution de base initiale. 'auto' calcule les trois méthodes et garde la moins chère
+    (à égalité : Vogel, puis Moindre Coût, puis Nord-Ouest).
 
-def stepping_stone(offres, demandes, couts):
+    Returns:
+        tuple: (solution, cout_total, nom de la méthode)
+    """
+    if methode_initiale == 'auto':
+        cles = ['vogel', 'moindre_cout', 'nord_ouest']
+    elif methode_initiale in METHODES_INITIALES:
+        cles = [methode_initiale]
+    else:
+        raise ValueError(f"Méthode initiale inconnue : '{methode_initiale}' (attendu 'auto', 'nord_ouest', 'moindre_cout' ou 'vogel').")
+    meilleure = None
+    for cle in cles:
+        nom, fonction = METHODES_INITIALES[cle]
+        # Ensure copies are passed to initial solution finders
+        sol, cout = fonction(list(offres), list(demandes), couts)
+        if meilleure is None or cout < meilleure[1]:
+            meilleure = (sol, cout, nom)
+    return meilleure
+
+
+def stepping_stone(offres, demandes, couts, methode_initiale='auto'):
     if sum(offres) != sum(demandes):
         raise ValueError("La somme des offres doit égaler la somme des demandes.")
-    
-    # Ensure copies are passed to initial solution finders
-    sol_nw, cout_nw = nord_ouest(list(offres), list(demandes), couts)
-    sol_mc, cout_mc = moindre_cout(list(offres), list(demandes), couts)
 
-    # Convert to numpy arrays for easier manipulation internally
-    if cout_mc < cout_nw:
-        solution_init_list = sol_mc
-        cout_total = float(cout_mc) # Ensure float
-        methode = "Moindre Coût"
-    else:
-        solution_init_list = sol_nw
-        cout_total = float(cout_nw) # Ensure float
-        methode = "Nord-Ouest"
+    solution_init_list, cout_init, methode = solution_initiale(offres, demandes, couts, methode_initiale)
 
     n = len(offres)
     m = len(demandes)
-    solution = np.array(solution_init_list, dtype=float) # Use float for solution for qte adjustments
-    couts_np = np.array(couts, dtype=float) # Ensure couts is also numpy array
+    solution = np.array(solution_init_list, dtype=np.int64).reshape(n, m)
+    couts_np = np.asarray(couts).reshape(n, m)
+    # Coûts entiers : calcul exact, sinon petite tolérance sur les coûts réduits
+    seuil = 0 if np.issubdtype(couts_np.dtype, np.integer) else 1e-9
 
     def calculer_cout(sol_calc):
         return np.sum(sol_calc * couts_np) # More efficient with numpy
-    
-    iterations = 0
-    max_iter = n * m * 2 # Heuristic for max iterations to prevent infinite loops
-
-    while iterations < max_iter:
-        iterations += 1
-        amélioration_trouvée_cette_iteration = False
-
-        # Calculer les potentiels u et v (méthode MODI / dual variables)
-        u = np.full(n, np.nan, dtype=float) # Initialize with NaN
-        v = np.full(m, np.nan, dtype=float)
-        
-        # Ancre u[0] = 0 pour les systèmes sous-déterminés
-        # (ou choisir une ligne/colonne avec le plus de cellules de base)
-        # For simplicity, u[0] = 0 is common if row 0 has basic variables.
-        # A more robust way is to find a row/col with most basic vars, or iterate.
-        
-        # Find first basic variable to anchor u and v calculations
-        first_basic_r, first_basic_c = -1, -1
-        for r_idx in range(n):
-            for c_idx in range(m):
-                if solution[r_idx, c_idx] > 1e-9: # Consider >0 as basic (epsilon for float)
-                    first_basic_r, first_basic_c = r_idx, c_idx
-                    break
-            if first_basic_r != -1:
-                break
-        
-        if first_basic_r == -1 : # No basic variables, solution is likely all zeros (degenerate)
-            # This case should ideally not happen if sum(offres)>0
-            # Or it means the problem is highly degenerate or already optimal in a trivial way.
-            break 
-
-        u[first_basic_r] = 0.0 # Anchor one u value
 
-        # Itérer pour calculer tous les u et v pour les cellules de base
-        # This needs to be iterative if graph of basic cells is not simple tree
-        for _ in range(n + m): # Iterate enough times to propagate values
-            for r_idx in range(n):
-                for c_idx in range(m):
-                    if solution[r_idx, c_idx] > 1e-9: # Pour les cellules de base (x_ij > 0)
-                        if not np.isnan(u[r_idx]) and np.isnan(v[c_idx]):
-                            v[c_idx] = couts_np[r_idx, c_idx] - u[r_idx]
-                        elif np.isnan(u[r_idx]) and not np.isnan(v[c_idx]):
-                            u[r_idx] = couts_np[r_idx, c_idx] - v[c_idx]
-        
-        if np.isnan(u).any() or np.isnan(v).any():
-            # This indicates a degenerate solution where not all u,v could be determined.
-            # Stepping stone path finding is harder here. For now, we might stop or need a more complex u,v.
-            # print("Warning: Degenerate solution, u/v calculation incomplete. Path finding may fail.")
-            # A common way to handle degeneracy is to add very small epsilon quantities.
-            # For now, let the path finding attempt it. If it fails, loop will break.
-            pass
+    # Base explicite de n + m - 1 cellules (cellules nulles admises si la solution est dégénérée)
+    arbre = ArbreBase(n, m, [tuple(c) for c in np.argwhere(solution > 0).tolist()], couts_np.tolist())
 
+    # Règle de Dantzig (coût réduit le plus négatif) ; après un pivot dégénéré (quantité nulle),
+    # règle de Bland (première cellule améliorante, première cellule sortante par indice)
+    # jusqu'au prochain pivot non dégénéré : une suite de pivots dégénérés ne peut donc pas boucler.
+    iterations = 0
+    bland = False
+    while True:
+        iterations += 1
 
-        # Calculer les coûts réduits (delta_ij = c_ij - u_i - v_j) pour les cellules hors base
-        meilleur_delta = 0
-        cellule_entrante = None
-
-        for r_idx in range(n):
-            for c_idx in range(m):
-                if solution[r_idx, c_idx] < 1e-9: # Pour les cellules hors base (x_ij = 0)
-                    if not np.isnan(u[r_idx]) and not np.isnan(v[c_idx]): # Check if u,v are calculated
-                        delta = couts_np[r_idx, c_idx] - u[r_idx] - v[c_idx]
-                        if delta < meilleur_delta:
-                            meilleur_delta = delta
-                            cellule_entrante = (r_idx, c_idx)
-        
-        if cellule_entrante is None or meilleur_delta >= -1e-9: # No improvement or negligible
+        # Coûts réduits delta_ij = c_ij - u_i - v_j (nuls sur la base)
+        u, v = arbre.potentiels()
+        delta = (couts_np - u[:, None] - v[None, :]).ravel()
+        if not delta.size:
+            break
+        k = int(np.argmax(delta < -seuil)) if bland else int(np.argmin(delta))
+        if delta[k] >= -seuil:
             break # Solution optimale trouvée
+        cellule_entrante = divmod(k, m)
 
-        # Amélioration possible, trouver le chemin et ajuster
-        r_in, c_in = cellule_entrante
-        chemin = trouver_chemin(solution, r_in, c_in) # This path finding needs to be robust
-
-        if chemin and len(chemin) >= 4: # Chemin trouvé
-            qte_a_transferer = float('inf')
-            # Les cellules impaires (1, 3, ...) dans le chemin sont celles où l'on soustrait
-            for idx, (r_path, c_path) in enumerate(chemin):
-                if idx % 2 == 1: # Cellules '-'
-                    qte_a_transferer = min(qte_a_transferer, solution[r_path, c_path])
-            
-            if qte_a_transferer == float('inf') or qte_a_transferer < 1e-9 : # No quantity to transfer or path error
-                # This can happen if path is bad or solution is highly degenerate
-                # print(f"Warning: Path found for {cellule_entrante} but no quantity to transfer or path error. Qte={qte_a_transferer}")
-                break # Stop if we can't improve meaningfully
-
+        # Cycle de la cellule entrante dans l'arbre ; les cellules impaires (1, 3, ...) sont les cellules '-'
+        chemin, enfants = arbre.cycle(*cellule_entrante)
+        moins = chemin[1::2]
+        qte_a_transferer = min(solution[c] for c in moins)
+        k_sortant = min((c[0] * m + c[1], idx) for idx, c in enumerate(moins) if solution[c] == qte_a_transferer)[1]
 
-            for idx, (r_path, c_path) in enumerate(chemin):
-                if idx % 2 == 0: # Cellules '+' (y compris la cellule entrante)
-                    solution[r_path, c_path] += qte_a_transferer
-                else: # Cellules '-'
-                    solution[r_path, c_path] -= qte_a_transferer
-            
-            cout_total = calculer_cout(solution)
-            amélioration_trouvée_cette_iteration = True
-        else: # Aucun chemin trouvé pour la cellule entrante la plus prometteuse
-            # This might mean the path finder failed or the u,v method hit a complex case.
-            # print(f"Warning: No valid Stepping Stone path found for entering cell {cellule_entrante} with delta {meilleur_delta}.")
-            break 
+        for idx, cellule in enumerate(chemin):
+            if idx % 2 == 0: # Cellules '+' (y compris la cellule entrante)
+                solution[cellule] += qte_a_transferer
+            else: # Cellules '-'
+                solution[cellule] -= qte_a_transferer
+        arbre.pivoter(cellule_entrante, moins[k_sortant], enfants[1::2][k_sortant])
+        bland = qte_a_transferer == 0
 
-        if not amélioration_trouvée_cette_iteration:
-            break # Sortir si aucune amélioration n'a été faite dans cette itération
+    solution_finale_list = solution.tolist()
 
-    # Convert solution back to list of lists of ints for consistency if desired
-    solution_finale_list = [[int(round(val)) for val in row] for row in solution]
-    
     return (
         solution_finale_list,
-        float(calculer_cout(solution)), # Recalculate with final solution (potentially rounded)
+        float(calculer_cout(solution)),
         iterations,
         methode, # Initial method
         solution_init_list, # Initial solution (list of lists)
-        float(cout_mc if methode == "Moindre Coût" else cout_nw), # Initial cost
-        solution_finale_list # Last solution state before potential rounding
-    )
\ No newline at end of file
+        float(cout_init), # Initial cost
+        solution_finale_list # Last solution state
+    )
@@ -0,0 +1,104 @@
+import numpy as np
+
+def vogel(offres, demandes, couts):
+    """
+    Résout le problème de transport par la méthode d'approximation de Vogel (VAM).
+
+    Pour chaque ligne et chaque colonne encore ouvertes, on garde les deux plus petits coûts
+    dans des tableaux NumPy ; la pénalité est leur écart. On sert la ligne ou la colonne de plus
+    forte pénalité (à égalité : plus petit coût, puis lignes avant colonnes, puis plus petit indice)
+    dans sa cellule la moins chère. Quand une ligne (colonne) est épuisée, seules les colonnes (lignes)
+    dont l'un des deux minimums tombait sur elle sont recalculées.
+
+    Args:
+        offres (list): Liste des offres pour chaque source.
+        demandes (list): Liste des demandes pour chaque destination.
+        couts (list): Matrice des coûts (sources x destinations).
+
+    Returns:
+        tuple: (solution, cout_total)
+            solution (list): Matrice de la solution (quantités transportées).
+            cout_total (float): Coût total de la solution.
+    """
+    if sum(offres) != sum(demandes):
+        raise ValueError("La somme des offres doit égaler la somme des demandes.")
+
+    n, m = len(offres), len(demandes)
+    solution = np.zeros((n, m), dtype=int)
+    offres_restantes = list(offres)
+    demandes_restantes = list(demandes)
+    cout_total = 0
+    if n == 0 or m == 0:
+        return solution.tolist(), cout_total
+
+    # Coûts des cellules encore ouvertes (inf dès que la ligne ou la colonne est épuisée)
+    C = np.array(couts, dtype=np.float64)
+    ligne_ouverte = np.array([o > 0 for o in offres_restantes])
+    colonne_ouverte = np.array([d > 0 for d in demandes_restantes])
+    C[~ligne_ouverte, :] = np.inf
+    C[:, ~colonne_ouverte] = np.inf
+
+    def deux_minimums(M):
+        """(min1, indice du min1, min2, indice du min2) de chaque ligne de M (à égalité, plus petit indice)."""
+        lignes = np.arange(len(M))
+        arg1 = np.argmin(M, axis=1)
+        min1 = M[lignes, arg1]
+        sauf_min1 = M.copy()
+        sauf_min1[lignes, arg1] = np.inf
+        arg2 = np.argmin(sauf_min1, axis=1)
+        return min1, arg1, sauf_min1[lignes, arg2], arg2
+
+    min1_l, arg1_l, min2_l, arg2_l = deux_minimums(C)
+    min1_c, arg1_c, min2_c, arg2_c = deux_minimums(C.T)
+
+    def penalites(min1, min2, ouvert):
+        # Une seule cellule ouverte : la pénalité est son coût
+        with np.errstate(invalid='ignore'): # inf - inf sur les lignes fermées
+            p = np.where(np.isinf(min2), min1, min2 - min1)
+        return np.where(ouvert & np.isfinite(min1), p, -np.inf)
+
+    pen_l = penalites(min1_l, min2_l, ligne_ouverte)
+    pen_c = penalites(min1_c, min2_c, colonne_ouverte)
+
+    while True:
+        meilleure_l = np.max(pen_l, initial=-np.inf)
+        meilleure_c = np.max(pen_c, initial=-np.inf)
+        meilleure = max(meilleure_l, meilleure_c)
+        if meilleure == -np.inf:
+            break
+        # Départage : plus petit coût minimal, lignes avant colonnes, plus petit indice
+        cand_l = np.flatnonzero(pen_l == meilleure)
+        cand_c = np.flatnonzero(pen_c == meilleure)
+        cle_l = min1_l[cand_l].min(initial=np.inf)
+        cle_c = min1_c[cand_c].min(initial=np.inf)
+        if cle_l <= cle_c:
+            i = int(cand_l[np.argmin(min1_l[cand_l])])
+            j = int(arg1_l[i])
+        else:
+            j = int(cand_c[np.argmin(min1_c[cand_c])])
+            i = int(arg1_c[j])
+
+        quantite = min(offres_restantes[i], demandes_restantes[j])
+        solution[i][j] = quantite
+        cout_total += quantite * couts[i][j]
+        offres_restantes[i] -= quantite
+        demandes_restantes[j] -= quantite
+
+        if offres_restantes[i] <= 0: # Ligne i épuisée
+            ligne_ouverte[i] = False
+            C[i, :] = np.inf
+            pen_l[i] = -np.inf
+            touchees = np.flatnonzero(colonne_ouverte & ((arg1_c == i) | (arg2_c == i)))
+            if len(touchees):
+                min1_c[touchees], arg1_c[touchees], min2_c[touchees], arg2_c[touchees] = deux_minimums(C[:, touchees].T)
+                pen_c[touchees] = penalites(min1_c[touchees], min2_c[touchees], colonne_ouverte[touchees])
+        if demandes_restantes[j] <= 0: # Colonne j épuisée
+            colonne_ouverte[j] = False
+            C[:, j] = np.inf
+            pen_c[j] = -np.inf
+            touchees = np.flatnonzero(ligne_ouverte & ((arg1_l == j) | (arg2_l == j)))
+            if len(touchees):
+                min1_l[touchees], arg1_l[touchees], min2_l[touchees], arg2_l[touchees] = deux_minimums(C[touchees])
+                pen_l[touchees] = penalites(min1_l[touchees], min2_l[touchees], ligne_ouverte[touchees])
+
+    return solution.tolist(), cout_total
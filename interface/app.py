@@ -17,6 +17,7 @@ import algos.mpm
 import algos.NordO
 import algos.moindre_cout
 import algos.stepping_stone
+import algos.simplexe_reseau
 import numpy as np
 import re
 import random
@@ -135,6 +136,7 @@ class Application:
             ("🏭 Nord-Ouest (transport)", "nordouest", 2, 0),
             ("💰 Moindre Coût", "cout", 2, 1),
             ("🪨 Stepping-Stone", "steep", 2, 2),
+            ("🧮 Gomory-Hu (coupes)", "gomory", 3, 0),
         ]
 
         button_frame = ttk.Frame(self.algo_win)
@@ -150,7 +152,7 @@ class Application:
             btn.grid(row=row, column=col, padx=15, pady=15, sticky="nsew")
             button_frame.grid_columnconfigure(col, weight=1)
         
-        for i in range(3):
+        for i in range(4):
             button_frame.grid_rowconfigure(i, weight=1)
 
         back_btn = ttk.Button(
@@ -307,6 +309,7 @@ class Application:
             "dijkstra": [("Nombre de sommets", "e.g. 6"), ("Noeud source", "e.g. A"),("Noeud destination (optionnel)", "e.g. F")],
             "bellman": [("Nombre de sommets", "e.g. 6"), ("Noeud source", "e.g. A"),("Noeud destination (optionnel)", "e.g. F")],
             "ford": [("Nombre de sommets", "e.g. 6"), ("Noeud source", "e.g. A"), ("Noeud puits", "e.g. F")],
+            "gomory": [("Nombre de sommets", "e.g. 8")],
             "metra": [("Nombre de tâches", "e.g. 4")],
             "nordouest": [("Nombre d'usines", "e.g. 3"), ("Nombre de magasins", "e.g. 3")],
             "cout": [("Nombre d'usines", "e.g. 3"), ("Nombre de magasins", "e.g. 3")],
@@ -529,18 +532,15 @@ class Application:
                 nb = self._validate_positive_integer_revised("Nombre de sommets", "Nombre de sommets")
                 if nb is None: return
     
-                graph, graph_couleur, densite = algos.welsh.welsh(nb)
-                result_text = str(graph_couleur)
+                G, graph_couleur, densite = algos.welsh.welsh(nb)
+                nb_couleurs = max(graph_couleur.values(), default=-1) + 1
+                result_text = f"Nombre de couleurs : {nb_couleurs}\n\n" + str(graph_couleur)
     
                 fig = Figure(figsize=(10, 6), dpi=100)
                 ax = fig.add_subplot(111)
-                G = nx.Graph()
-                for node in graph: G.add_node(node)
-                for node, voisins in graph.items():
-                    for voisin, _ in voisins:
-                        if not G.has_edge(node, voisin): G.add_edge(node, voisin)
                 pos = nx.spring_layout(G, seed=42)
-                node_colors = [graph_couleur[node] for node in G.nodes()]
+                palette = algos.welsh.palette_couleurs(nb_couleurs) # Couleurs entières -> affichage
+                node_colors = [palette[graph_couleur[node]] for node in G.nodes()]
                 nx.draw(G, pos, with_labels=True, node_color=node_colors, ax=ax, node_size=600, font_size=10)
                 taux_str = f"{round(densite * 100, 2)}%"
                 ax.set_title(f"Coloration du graphe (Welsh-Powell)\nTaux de connexité : {taux_str}")
@@ -557,10 +557,18 @@ class Application:
                 if nb is None: return
 
                 total_weight, mst, G, densite = algos.kruskal.kruskal(nb)
+                nb_composantes = mst.graph.get('nb_composantes', 1)
+                libelle_arbre = "l'arbre couvrant minimal" if nb_composantes <= 1 else "la forêt couvrante minimale"
                 result_text = (
-                    f"Poids total de l'arbre couvrant minimal : {total_weight}\n"
+                    f"Poids total de {libelle_arbre} : {total_weight}\n"
+                    f"Composantes connexes : {nb_composantes}\n"
+                    f"Moteur : {mst.graph.get('moteur', 'kruskal')}\n"
                     f"Taux de connexité du graphe généré : {densite:.2%}" # densite is already percentage
                 )
+                if nb_composantes > 1:
+                    result_text += "\n\nArbres de la forêt (nœuds : poids) :\n"
+                    for membres_c, poids_c in mst.graph.get('composantes', []):
+                        result_text += f"  {', '.join(membres_c)} : {poids_c}\n"
                 fig = Figure(figsize=(8, 6), dpi=100)
                 ax = fig.add_subplot(111)
                 pos = nx.spring_layout(G, seed=42)
@@ -572,9 +580,10 @@ class Application:
                 nx.draw_networkx_edges(G, pos, edgelist=mst.edges(), edge_color="red", width=2, ax=ax)
                 edge_labels = nx.get_edge_attributes(G, 'weight')
                 nx.draw_networkx_edge_labels(G, pos, edge_labels=edge_labels, ax=ax)
-                red_line = Line2D([], [], color='red', linewidth=2, label=f"Arbre couvrant minimal : {total_weight}")
+                titre_arbre = "Arbre couvrant minimal" if nb_composantes <= 1 else f"Forêt couvrante minimale ({nb_composantes} composantes)"
+                red_line = Line2D([], [], color='red', linewidth=2, label=f"{titre_arbre} : {total_weight}")
                 ax.legend(handles=[red_line], loc="upper right")
-                ax.set_title(f"Arbre couvrant minimal - Kruskal\nTaux de connexité : {densite:.2%}")
+                ax.set_title(f"{titre_arbre} - {mst.graph.get('moteur', 'kruskal').capitalize()}\nTaux de connexité : {densite:.2%}")
                 self.display_graph(fig)
                 self.display_text(result_text)
                 
@@ -690,14 +699,20 @@ class Application:
                     edge_weights_labels_bf = nx.get_edge_attributes(G_bellman, 'weight')
                     nx.draw_networkx_edge_labels(G_bellman, pos_bellman, edge_labels=edge_weights_labels_bf, font_size=8, font_color='black', ax=ax, bbox=dict(facecolor='white', alpha=0.4, edgecolor='none', pad=0))
                     legend_handles_bf = []
-                    if dest_bellman and path_to_dest_edges:
+                    cycle_negatif_bf = "cycle négatif" in result_text_bellman.lower()
+                    if cycle_negatif_bf and path_to_dest_edges:
+                        # En cas de cycle négatif, path_to_dest_edges contient les arêtes du cycle
+                        nx.draw_networkx_edges(G_bellman, pos_bellman, edgelist=path_to_dest_edges, edge_color='crimson', width=3.0, style='dashed', arrows=True, arrowstyle='-|>', arrowsize=22, connectionstyle='arc3,rad=0.1', ax=ax)
+                        handle = mlines.Line2D([], [], color='crimson', linestyle='dashed', label=f"Cycle négatif ({len(path_to_dest_edges)} arcs)", linewidth=3.0)
+                        legend_handles_bf.append(handle)
+                    elif dest_bellman and path_to_dest_edges:
                         nx.draw_networkx_edges(G_bellman, pos_bellman, edgelist=path_to_dest_edges, edge_color='red', width=2.5, arrows=True, arrowstyle='-|>', arrowsize=20, connectionstyle='arc3,rad=0.1', ax=ax, label=f"Chemin {src_bellman} → {dest_bellman}")
                         dist_to_dest_val = distances_bellman.get(dest_bellman, '∞')
                         path_legend_label = f"{src_bellman} → {dest_bellman} (Coût: {dist_to_dest_val})"
                         handle = mlines.Line2D([], [], color='red', label=path_legend_label, linewidth=2.5)
                         legend_handles_bf.append(handle)
                     if legend_handles_bf:
-                        ax.legend(handles=legend_handles_bf, title="Chemin vers Destination", loc='upper left', bbox_to_anchor=(0, 1.10), fontsize=9, title_fontsize=10, frameon=True, facecolor='whitesmoke', edgecolor='lightgray')
+                        ax.legend(handles=legend_handles_bf, title="Cycle négatif" if cycle_negatif_bf else "Chemin vers Destination", loc='upper left', bbox_to_anchor=(0, 1.10), fontsize=9, title_fontsize=10, frameon=True, facecolor='whitesmoke', edgecolor='lightgray')
                     title_str_bf = f"Bellman-Ford depuis {src_bellman}"
                     if dest_bellman: title_str_bf += f" vers {dest_bellman}"
                     title_str_bf += f"\nTaux de connexité : {conn_rate_bellman:.2f}%" # Already percent
@@ -792,6 +807,46 @@ class Application:
                 if hasattr(self, 'rate_btn') and self.rate_btn.winfo_exists(): # S'assurer que le bouton existe
                     self.rate_btn.config(state="normal")
 
+            elif algo_key == "gomory":
+                nb_gh = self._validate_positive_integer_revised("Nombre de sommets", "Nombre de sommets", min_value=2)
+                if nb_gh is None: return
+
+                try:
+                    arbre_gh, G_gh, conn_rate_gh = algos.ford.gomory_hu(nb_gh)
+                except ValueError as ve:
+                    messagebox.showerror("Erreur de configuration", str(ve), parent=self.input_win)
+                    self.display_text(f"Erreur de configuration : {str(ve)}")
+                    self.display_graph(None)
+                    return
+
+                matrice_gh = arbre_gh.matrice()
+                noms_gh = arbre_gh.noms
+                result_text_gh = "🧮 Cas d'utilisation : Coupes minimales entre toutes les paires (arbre de Gomory-Hu)\n\n"
+                result_text_gh += f"Arêtes de l'arbre ({nb_gh - 1}) :\n"
+                for enfant_gh, parent_gh, cap_gh in arbre_gh.aretes():
+                    result_text_gh += f"  {enfant_gh} — {parent_gh} : {cap_gh}\n"
+                if nb_gh <= 26:
+                    result_text_gh += "\nMatrice des coupes minimales :\n"
+                    result_text_gh += "     " + "".join(f"{nom:>5}" for nom in noms_gh) + "\n"
+                    for nom_ligne, ligne in zip(noms_gh, matrice_gh.tolist()):
+                        result_text_gh += f"{nom_ligne:>5}" + "".join(f"{val:>5}" for val in ligne) + "\n"
+                result_text_gh += f"\nTaux de connexité généré : {conn_rate_gh:.2f}%"
+
+                fig = Figure(figsize=(10, 8), dpi=100)
+                ax = fig.add_subplot(111)
+                image_gh = ax.imshow(matrice_gh, cmap='viridis', interpolation='nearest')
+                fig.colorbar(image_gh, ax=ax, label="Coupe minimale (capacité)")
+                if nb_gh <= 40:
+                    ax.set_xticks(range(nb_gh)); ax.set_xticklabels(noms_gh, fontsize=8, rotation=90)
+                    ax.set_yticks(range(nb_gh)); ax.set_yticklabels(noms_gh, fontsize=8)
+                ax.set_title(f"Coupes minimales entre paires (Gomory-Hu, {nb_gh} nœuds)\n" f"Taux de connexité : {conn_rate_gh:.2f}%", fontsize=13, pad=15)
+                self.display_graph(fig)
+                self.display_text(result_text_gh)
+
+                self.current_algo_data['connexity_rate'] = conn_rate_gh
+                if hasattr(self, 'rate_btn') and self.rate_btn.winfo_exists(): # S'assurer que le bouton existe
+                    self.rate_btn.config(state="normal")
+
             elif algo_key == "metra":
                 nb_tasks_metra = self._validate_positive_integer_revised("Nombre de tâches", "Nombre de tâches")
                 if nb_tasks_metra is None: return
@@ -1308,13 +1363,14 @@ class Application:
                             messagebox.showerror("Erreur de Données", "Offres, demandes et coûts doivent être >= 0.", parent=data_win)
                             return
 
+                        nom_solveur_ss = solveur_var_ss.get()
                         solution_ss, cout_total_ss, iterations_ss, methode_init_ss, solution_initiale_liste_ss, cout_initial_val_ss_num, _ = \
-    algos.stepping_stone.stepping_stone(offres_list, demandes_list, couts_list)
+    solveurs_ss[nom_solveur_ss](offres_list, demandes_list, couts_list, methode_initiale=initialisations_ss[initialisation_var_ss.get()])
                         
-                        result_text_ss = f"🪨 Stepping-Stone\n"
+                        result_text_ss = f"🪨 {nom_solveur_ss}\n"
                         result_text_ss += f"Méthode d'initialisation: {methode_init_ss}\n"
                         result_text_ss += f"Coût initial ({methode_init_ss}): {cout_initial_val_ss_num:.2f}\n" # UTILISER LA VARIABLE CORRIGÉE
-                        result_text_ss += f"Coût optimisé (Stepping Stone): {cout_total_ss:.2f} (après {iterations_ss} itérations)\n\n"
+                        result_text_ss += f"Coût optimisé ({nom_solveur_ss}): {cout_total_ss:.2f} (après {iterations_ss} itérations)\n\n"
                         
                         header_txt_ss = ["U\\M"] + [f"M{j+1}" for j in range(n_magasins)] + ["Offre"]
                         result_text_ss += "{:<5}".format(header_txt_ss[0]) + "\t" + "\t".join(["{:<10}".format(h) for h in header_txt_ss[1:-1]]) + "\t" + "{:<8}".format(header_txt_ss[-1]) + "\n"
@@ -1357,7 +1413,7 @@ class Application:
                                     else: 
                                         cell_ss.set_text_props(color='gray')
                         
-                        title_ss = f"Stepping-Stone: Coût Initial ({methode_init_ss}) = {cout_initial_val_ss_num:.2f}\n" # UTILISER LA VARIABLE CORRIGÉE
+                        title_ss = f"{nom_solveur_ss}: Coût Initial ({methode_init_ss}) = {cout_initial_val_ss_num:.2f}\n" # UTILISER LA VARIABLE CORRIGÉE
                         title_ss += f"Coût Optimisé = {cout_total_ss:.2f} (après {iterations_ss} itérations)"
                         ax_ss.set_title(title_ss, fontsize=13, pad=25)
                         
@@ -1378,6 +1434,17 @@ class Application:
                 ttk.Button(action_buttons_frame_ss, text="♻️ Générer Données", command=generate_random_data_action_ss).pack(side=tk.LEFT, padx=10)
                 ttk.Button(action_buttons_frame_ss, text="✅ Valider et Exécuter", command=submit_data_action_ss).pack(side=tk.LEFT, padx=5)
                 ttk.Button(action_buttons_frame_ss, text="❌ Annuler", command=data_win.destroy).pack(side=tk.RIGHT, padx=5)
+
+                # Choix du solveur (le simplexe réseau est destiné aux grandes instances) et de la solution initiale
+                solveurs_ss = {"Stepping-Stone": algos.stepping_stone.stepping_stone, "Simplexe réseau": algos.simplexe_reseau.simplexe_reseau}
+                initialisations_ss = {"Automatique (la moins chère)": 'auto', "Nord-Ouest": 'nord_ouest', "Moindre Coût": 'moindre_cout', "Vogel": 'vogel'}
+                options_frame_ss = ttk.Frame(content_main_frame); options_frame_ss.pack(fill=tk.X, pady=(10,0), side=tk.BOTTOM)
+                ttk.Label(options_frame_ss, text="Solveur :").pack(side=tk.LEFT, padx=(10,5))
+                solveur_var_ss = tk.StringVar(value="Stepping-Stone")
+                ttk.Combobox(options_frame_ss, textvariable=solveur_var_ss, values=list(solveurs_ss), state='readonly', width=18).pack(side=tk.LEFT, padx=5)
+                ttk.Label(options_frame_ss, text="Solution initiale :").pack(side=tk.LEFT, padx=(15,5))
+                initialisation_var_ss = tk.StringVar(value="Automatique (la moins chère)")
+                ttk.Combobox(options_frame_ss, textvariable=initialisation_var_ss, values=list(initialisations_ss), state='readonly', width=26).pack(side=tk.LEFT, padx=5)
                 generate_random_data_action_ss()
 
             else:
@@ -0,0 +1,34 @@
+import numpy as np
+from algos.cpm import ReseauCPM
+from algos.pert import simulation_pert
+
+
+def _verifier_comme_cpm(taches):
+    """Durées certaines (a = m = b) : chaque scénario doit redonner exactement le calcul CPM."""
+    certaines = {nom: {'duree': (d['duree'],) * 3, 'pred': d['pred']} for nom, d in taches.items()}
+    fins, quantiles, criticite = simulation_pert(certaines, nb_scenarios=200, graine=0)
+    dates = ReseauCPM(taches).calculer_dates()
+    fin_cpm = dates['tft'][-1]
+    assert np.all(fins == fin_cpm)
+    assert quantiles['moyenne'] == fin_cpm
+    for i, nom in enumerate(taches, start=1):
+        assert criticite[nom] == (1.0 if dates['marge'][i] == 0 else 0.0)
+
+
+def test_pert_certain_egal_cpm():
+    _verifier_comme_cpm({
+        'A': {'duree': 3, 'pred': []},
+        'B': {'duree': 2, 'pred': ['A']},
+        'C': {'duree': 4, 'pred': ['A']},
+        'D': {'duree': 1, 'pred': ['B', 'C']},
+        'E': {'duree': 2, 'pred': []},
+    })
+
+
+def test_pert_predecesseurs_inconnus():
+    # A n'a que des prédécesseurs inconnus : elle est au premier niveau sans arc depuis Début
+    _verifier_comme_cpm({
+        'A': {'duree': 2, 'pred': ['ZZ']},
+        'B': {'duree': 2, 'pred': ['A']},
+        'C': {'duree': 1, 'pred': ['ZZ']},
+    })
@@ -0,0 +1,55 @@
+import time
+import networkx as nx
+import numpy as np
+from algos.simplexe_reseau import simplexe_reseau
+from algos.stepping_stone import stepping_stone
+
+
+def _instance(n, m, graine):
+    rng = np.random.default_rng(graine)
+    offres = rng.integers(1, 100, n)
+    demandes = np.bincount(rng.integers(0, m, int(offres.sum())), minlength=m)
+    return offres.tolist(), demandes.tolist(), rng.integers(1, 1000, (n, m)).tolist()
+
+
+def _cout_optimal(offres, demandes, couts):
+    G = nx.DiGraph()
+    for i, o in enumerate(offres):
+        G.add_node(('s', i), demand=-o)
+    for j, d in enumerate(demandes):
+        G.add_node(('d', j), demand=d)
+    for i, ligne in enumerate(couts):
+        for j, c in enumerate(ligne):
+            G.add_edge(('s', i), ('d', j), weight=c)
+    return nx.min_cost_flow_cost(G)
+
+
+def _verifier(offres, demandes, couts, resultat):
+    solution = np.array(resultat[0])
+    assert np.all(solution >= 0)
+    assert solution.sum(axis=1).tolist() == list(offres)
+    assert solution.sum(axis=0).tolist() == list(demandes)
+    assert resultat[1] == float(np.sum(solution * np.array(couts)))
+
+
+def test_optimal_comme_networkx():
+    for graine in range(20):
+        offres, demandes, couts = _instance(3 + graine % 7, 4 + graine % 5, graine)
+        for methode in ('nord_ouest', 'moindre_cout', 'vogel'):
+            resultat = simplexe_reseau(offres, demandes, couts, methode)
+            _verifier(offres, demandes, couts, resultat)
+            assert resultat[1] == _cout_optimal(offres, demandes, couts)
+
+
+def test_meme_cout_que_stepping_stone():
+    offres, demandes, couts = _instance(60, 50, 7)
+    assert simplexe_reseau(offres, demandes, couts)[1] == stepping_stone(offres, demandes, couts)[1]
+
+
+def test_1000x1000_en_quelques_secondes():
+    offres, demandes, couts = _instance(1000, 1000, 0)
+    debut = time.perf_counter()
+    resultat = simplexe_reseau(offres, demandes, couts)
+    duree = time.perf_counter() - debut
+    _verifier(offres, demandes, couts, resultat)
+    assert duree < 10, f"1000x1000 résolu en {duree:.1f} s"